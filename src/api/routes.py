@@ -1,30 +1,73 @@
 """FastAPI routes for GitHub profile analysis - MVC Architecture"""
-from fastapi import APIRouter
+from typing import List, Optional, Union
 
-from models.schemas import AnalyzeRequest, AnalyzeResponse, ReportRequest
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query
+
+from models.schemas import (
+    AnalyzeRequest, AnalyzeResponse, BatchAnalyzeRequest, ErrorResponse, ReportRequest
+)
 from controllers.analysis_controller import AnalysisController
 from controllers.report_controller import ReportController
-from services.cache_service import clear_all_cache
+from controllers.cache_controller import CacheController
+from utils.rate_limiter import RateLimiter
+from core.config import settings
 
 
 router = APIRouter()
 
+# Per-client limit on the endpoints that can trigger GitHub fetches
+rate_limiter = RateLimiter(
+    limit=settings.RATE_LIMIT_PER_MINUTE,
+    window_seconds=60,
+    client_header=settings.RATE_LIMIT_CLIENT_HEADER or None
+)
+
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_profile(request: AnalyzeRequest) -> AnalyzeResponse:
+@router.post("/analyze", response_model=AnalyzeResponse, dependencies=[Depends(rate_limiter)])
+async def analyze_profile(
+    request: AnalyzeRequest,
+    background_tasks: BackgroundTasks,
+    if_none_match: Optional[str] = Header(None),
+    include_markdown: bool = Query(True, description="Include markdown file contents (false: metadata only)")
+):
     """
     **Analyze GitHub Profile**
     
     Fetch complete GitHub user data including repositories, languages, and README files.
     
     **Input**: `{"github_input": "username"}` or full GitHub URL  
-    **Output**: User profile + repository data + performance metrics
+    **Output**: User profile + repository data + performance metrics  
+    **Headers**: `X-Cache: HIT|MISS`, `ETag` (send back as `If-None-Match`: 412 if unchanged)  
+    **Query**: `include_markdown=false` returns markdown files without their content
     """
-    return await AnalysisController.analyze_profile(request)
+    return await AnalysisController.analyze_profile(request, background_tasks, if_none_match, include_markdown)
+
+
+@router.post(
+    "/analyze/batch",
+    response_model=List[Union[AnalyzeResponse, ErrorResponse]],
+    dependencies=[Depends(rate_limiter)]
+)
+async def analyze_profiles_batch(
+    request: BatchAnalyzeRequest,
+    background_tasks: BackgroundTasks,
+    include_markdown: bool = Query(True, description="Include markdown file contents (false: metadata only)")
+):
+    """
+    **Analyze Multiple GitHub Profiles**
+    
+    Analyze up to 32 profiles in one request. Uncached profiles are fetched
+    concurrently.
+    
+    **Input**: `{"github_inputs": ["torvalds", "https://github.com/octocat"]}`  
+    **Output**: One analysis (or error) per input, in input order  
+    **Query**: `include_markdown=false` returns markdown files without their content
+    """
+    return await AnalysisController.analyze_batch(request, background_tasks, include_markdown)
 
 
 @router.post("/reports/generate")
-async def generate_report(request: ReportRequest):
+async def generate_report(request: ReportRequest, background_tasks: BackgroundTasks):
     """
     **Generate Comprehensive Report**
     
@@ -34,7 +77,18 @@ async def generate_report(request: ReportRequest):
     **Output**: Full hiring report with technical assessment  
     **Speed**: 2-3s (cached) | 8-12s (fresh fetch)
     """
-    return await ReportController.generate_report(request)
+    return await ReportController.generate_report(request, background_tasks)
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """
+    **Cache Hit Rates**
+    
+    Rolling hit-rate per activity-age bucket (how recently the user was active),
+    for tuning CACHE_MIN_TTL_SECONDS / CACHE_MAX_TTL_SECONDS. Per worker.
+    """
+    return await CacheController.stats()
 
 
 @router.delete("/cache/clear")
@@ -44,8 +98,14 @@ async def clear_cache():
     
     Remove all cached GitHub API responses. Next requests will fetch fresh data.
     """
-    await clear_all_cache()
-    return {
-        "status": "success",
-        "message": "Cache cleared successfully"
-    }
+    return await CacheController.clear_all()
+
+
+@router.delete("/cache/{username}")
+async def clear_user_cache(username: str):
+    """
+    **Clear Cache for One User**
+    
+    Remove the cached analysis for a single GitHub user. Other users stay cached.
+    """
+    return await CacheController.clear_user(username)
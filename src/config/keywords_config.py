@@ -7,7 +7,8 @@ GitHub repositories into domains, detect frameworks, and identify specialization
 HOW TO MODIFY:
 1. Add new keywords to existing categories by appending to the lists
 2. Create new categories by adding new dictionary entries
-3. Keywords are case-insensitive (automatically lowercased during matching)
+3. Keywords are case-insensitive (lowercased once at import, matched against
+   lowercased repo text)
 4. Use specific keywords to avoid false positives (e.g., "react" not "re")
 
 MATCHING LOGIC:
@@ -16,6 +17,9 @@ MATCHING LOGIC:
 - Longer keywords use substring matching
 """
 
+import sys
+from types import MappingProxyType
+
 # ============================================================================
 # DOMAIN CLASSIFICATION KEYWORDS
 # ============================================================================
@@ -800,6 +804,118 @@ FEATURE_KEYWORDS = {
 }
 
 
+# ============================================================================
+# FROZEN TABLES
+# ============================================================================
+# Edit the literals above; they are frozen here once at import. Keyword lists
+# become lowercase tuples (order is kept: it decides ties between equally
+# frequent frameworks). Category names and keywords are interned, so a
+# keyword listed in several places is one string object everywhere.
+
+def _freeze(categories):
+    """Return {interned category: tuple of interned lowercase keywords}."""
+    return {
+        sys.intern(category): tuple(sys.intern(kw.lower()) for kw in keywords)
+        for category, keywords in categories.items()
+    }
+
+
+DOMAIN_KEYWORDS = _freeze(DOMAIN_KEYWORDS)
+DOMAIN_WEIGHTS = {sys.intern(domain): weight for domain, weight in DOMAIN_WEIGHTS.items()}
+TECH_KW_CATEGORIES = _freeze(TECH_KW_CATEGORIES)
+FEATURE_KEYWORDS = _freeze(FEATURE_KEYWORDS)
+
+
+# ============================================================================
+# INVERTED KEYWORD INDEXES
+# ============================================================================
+# Each keyword maps to every (category, weight) pair whose list contains it,
+# so matching tests each distinct keyword once and fans out to its categories
+# instead of rescanning every category list.
+#
+# The indexes are built on first access (PEP 562 module __getattr__), so an
+# importer that only needs the raw tables, or never touches the feature
+# index, doesn't pay for them.
+
+def _build_keyword_index(categories, weights=None):
+    """
+    Invert a frozen {category: (keywords)} mapping (keywords already lowercase).
+    
+    Returns:
+        dict: {keyword: [(category, weight), ...]} in category order
+    """
+    index = {}
+    for category, keywords in categories.items():
+        weight = weights.get(category, 1.0) if weights else 1.0
+        for kw in keywords:
+            index.setdefault(kw, []).append((category, weight))
+    return index
+
+
+def _build_duplicate_keywords():
+    """
+    Keywords listed under more than one category. They are still scanned
+    once; a match counts toward every listing category (for domains) or
+    maps to the last listing category (for tech, see get_all_keywords_flat).
+    """
+    return frozenset(
+        kw for index in (_table("KEYWORD_INDEX"), _table("TECH_KEYWORD_INDEX"))
+        for kw, postings in index.items() if len(postings) > 1
+    )
+
+
+def _build_domain_columns():
+    """
+    Domain table as parallel columns, indexed by domain id (configured order).
+    
+    Returns:
+        tuple: (names, weights, {keyword: (domain_id, ...)})
+    """
+    names = tuple(DOMAIN_KEYWORDS)
+    weights = tuple(DOMAIN_WEIGHTS.get(domain, 1.0) for domain in names)
+    keyword_ids = {}
+    for domain_id, domain in enumerate(names):
+        for kw in DOMAIN_KEYWORDS[domain]:
+            keyword_ids[kw] = keyword_ids.get(kw, ()) + (domain_id,)
+    return names, weights, keyword_ids
+
+
+def _build_flat_keywords():
+    """
+    Read-only {keyword: category} view over the technology table. A keyword
+    listed under several categories maps to the last one.
+    """
+    return MappingProxyType(
+        {kw: postings[-1][0] for kw, postings in _table("TECH_KEYWORD_INDEX").items()}
+    )
+
+
+_LAZY_TABLES = {
+    "KEYWORD_INDEX": lambda: _build_keyword_index(DOMAIN_KEYWORDS, DOMAIN_WEIGHTS),
+    "TECH_KEYWORD_INDEX": lambda: _build_keyword_index(TECH_KW_CATEGORIES),
+    "FEATURE_KEYWORD_INDEX": lambda: _build_keyword_index(FEATURE_KEYWORDS),
+    "DUPLICATE_KEYWORDS": _build_duplicate_keywords,
+    "DOMAIN_COLUMNS": _build_domain_columns,
+    "FLAT_KEYWORDS": _build_flat_keywords,
+}
+
+
+def __getattr__(name):
+    """Build a derived table on first access and keep it as a module global."""
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+def _table(name):
+    """Module-internal access to a lazy table (globals don't go through __getattr__)."""
+    if name in globals():  # Built already, even if empty
+        return globals()[name]
+    return __getattr__(name)
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -809,14 +925,33 @@ def get_all_keywords_flat():
     Returns a flattened dictionary mapping each keyword to its category.
     Used for quick lookups during analysis.
     
+    A keyword listed under several categories maps to the last one. Built
+    once and shared, so the mapping is read-only.
+    
     Returns:
-        dict: {keyword: category}
+        MappingProxyType: {keyword: category}
     """
-    flat_map = {}
-    for category, keywords in TECH_KW_CATEGORIES.items():
-        for kw in keywords:
-            flat_map[kw.lower()] = category
-    return flat_map
+    return _table("FLAT_KEYWORDS")
+
+
+def get_domain_keyword_index():
+    """Returns the inverted domain index: {keyword: [(domain, weight), ...]}."""
+    return _table("KEYWORD_INDEX")
+
+
+def get_domain_columns():
+    """Returns (domain names, domain weights, {keyword: domain ids}) as parallel columns."""
+    return _table("DOMAIN_COLUMNS")
+
+
+def get_tech_keyword_index():
+    """Returns the inverted technology index: {keyword: [(category, 1.0), ...]}."""
+    return _table("TECH_KEYWORD_INDEX")
+
+
+def get_feature_keyword_index():
+    """Returns the inverted feature index: {keyword: [(category, 1.0), ...]}."""
+    return _table("FEATURE_KEYWORD_INDEX")
 
 
 def get_domain_keywords():
@@ -13,8 +13,10 @@ No business logic should be in controllers - delegate to services.
 
 from controllers.analysis_controller import AnalysisController
 from controllers.report_controller import ReportController
+from controllers.cache_controller import CacheController
 
 __all__ = [
     'AnalysisController',
-    'ReportController'
+    'ReportController',
+    'CacheController'
 ]
@@ -4,19 +4,165 @@ Analysis Controller
 Handles HTTP requests for GitHub profile analysis.
 Delegates business logic to AnalysisService.
 """
-import uuid
+import secrets
 import time
-from datetime import datetime
-from typing import Dict, Any
+import asyncio
+import hashlib
+from typing import Dict, Any, List, Optional
 
-from fastapi import HTTPException
-from models.schemas import AnalyzeRequest, AnalyzeResponse, UserData, RepositoryData, PerformanceMetrics
-from services.github_service import GitHubService
-from services.cache_service import get_cache, set_cache
+import orjson
+
+from fastapi import BackgroundTasks, HTTPException
+from fastapi.responses import Response
+from models.schemas import (
+    AnalyzeRequest, AnalyzeResponse, BatchAnalyzeRequest, ErrorResponse,
+    UserData, RepositoryData, PerformanceMetrics
+)
+from services.github_service import get_github_service
+from services.cache_service import (
+    get_cache, set_cache, adaptive_ttl, activity_age_seconds, activity_bucket, record_cache_outcome
+)
 from services.storage_service import storage_service
 from utils.validators import normalize_github_input
 from utils.logger import logger
-from core.config import settings
+from utils.responses import OrjsonResponse
+from utils.clock import utc_now_iso
+from utils.singleflight import SingleFlight
+from core.config import settings, ANALYZE_TIMEOUT_SECONDS, CACHE_SOFT_TTL_RATIO
+from core.exceptions import RateLimitError
+
+
+# RepositoryData fields with their defaults (None marks a required field)
+_REPOSITORY_FIELDS = [
+    (name, None if field.is_required() else field)
+    for name, field in RepositoryData.model_fields.items()
+]
+
+def _profile_etag(user: Dict[str, Any], repositories: List[Dict[str, Any]]) -> str:
+    """Content hash of the profile data (request-specific fields excluded)."""
+    body = orjson.dumps([user, repositories], default=str, option=orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _etag(response_data: Dict[str, Any]) -> str:
+    # Entries cached before ETags existed are hashed on demand
+    etag = response_data.get("etag") or _profile_etag(response_data["user"], response_data["repositories"])
+    return f'"{etag}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match check with weak comparison (RFC 7232 section 3.2).
+    
+    Entity-tags are compared without their `W/` prefix, so validators a
+    proxy weakened (e.g. when gzipping) still match; list items may be
+    separated with or without spaces.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _response_body(response_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AnalyzeResponse-shaped body without re-validation.
+    
+    Payloads are built from UserData/RepositoryData/PerformanceMetrics dumps
+    (fresh or cached), so validating them again would only burn CPU; this
+    just drops cache-only keys ("etag", "activity_bucket", "cached_at", "ttl").
+    """
+    return {
+        field: response_data[field]
+        for field in AnalyzeResponse.model_fields
+        if field in response_data
+    }
+
+
+def _without_markdown_content(body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a response body with markdown file contents nulled out.
+    
+    File names, paths and lengths stay; only `content` (the bulk of most
+    payloads) is dropped. The shared cached dicts are not modified.
+    """
+    return {
+        **body,
+        "repositories": [
+            {
+                **repo,
+                "markdown_files": [{**md, "content": None} for md in repo["markdown_files"]],
+            } if repo.get("markdown_files") else repo
+            for repo in body["repositories"]
+        ],
+    }
+
+
+def _repository_body(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    RepositoryData-shaped dict from a GitHubService repo, without validation.
+    
+    GitHubService builds every repo (and its languages/readme/markdown
+    entries) with exactly the model's types, so this only keeps the model's
+    fields, in model order, and fills defaults - the same dict validating
+    and dumping a RepositoryData gives, at a fraction of the cost. Extra
+    keys (dependency_files) are dropped; a missing required field raises
+    KeyError.
+    """
+    return {
+        name: repo[name] if field is None or name in repo else field.get_default(call_default_factory=True)
+        for name, field in _REPOSITORY_FIELDS
+    }
+
+
+def _cache_entry(response_data: Dict[str, Any], ttl: int) -> Dict[str, Any]:
+    """
+    Response dict as cached, plus when it was written and for how long
+    (drives background refresh).
+    """
+    return {**response_data, "cached_at": time.time(), "ttl": ttl}
+
+
+# Ceiling on concurrent GitHub profile fetches across all requests
+_gh_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_GH)
+
+
+# Fetches holding a semaphore slot (strong refs until done)
+_gh_fetches = set()
+
+
+def _release_gh_slot(fetch: asyncio.Future):
+    _gh_fetches.discard(fetch)
+    _gh_semaphore.release()
+    if not fetch.cancelled():
+        fetch.exception()  # Retrieved, so a failure after a timeout isn't logged as unhandled
+
+
+async def _fetch_bounded(github_service, username: str) -> Dict[str, Any]:
+    """
+    One profile fetch, gated by the semaphore.
+    
+    The ANALYZE_TIMEOUT_SECONDS clock starts once a slot is acquired, so
+    queueing under load doesn't turn valid analyses into 504s. The slot is
+    held until the fetch itself finishes: a caller that times out gets its
+    504, but the shielded fetch runs on (and still fills the cache) while
+    counting against MAX_CONCURRENT_GH.
+    """
+    await _gh_semaphore.acquire()
+    fetch = asyncio.ensure_future(github_service.analyze_profile(username))
+    _gh_fetches.add(fetch)
+    fetch.add_done_callback(_release_gh_slot)
+    return await asyncio.wait_for(asyncio.shield(fetch), timeout=ANALYZE_TIMEOUT_SECONDS)
+
+
+# In-flight GitHub fetches keyed by cache key (request coalescing)
+_analyze_flight = SingleFlight()
+
+# Background refreshes of stale-but-valid entries (strong refs until done)
+_refresh_tasks = set()
 
 
 class AnalysisController:
@@ -32,118 +178,320 @@ class AnalysisController:
     """
     
     @staticmethod
-    async def analyze_profile(request: AnalyzeRequest) -> AnalyzeResponse:
+    async def analyze_profile(
+        request: AnalyzeRequest,
+        background_tasks: Optional[BackgroundTasks] = None,
+        if_none_match: Optional[str] = None,
+        include_markdown: bool = True
+    ) -> Response:
         """
         Analyze GitHub profile - main analysis endpoint.
         
         Process:
         1. Normalize input (username/URL → username)
-        2. Check cache (24h TTL)
-        3. If cache miss → Fetch from GitHub
-        4. Save to storage (optional)
-        5. Cache result
+        2. Check cache (adaptive TTL); a hit past CACHE_SOFT_TTL_RATIO of
+           its TTL is still served, and refetched in the background
+        3. If cache miss → Fetch from GitHub (coalesced per username)
+        4. Build and cache the response (before coalesced callers are released)
+        5. Save to storage
         6. Return formatted response
         
+        Step 5 runs as a background task after the response is sent when
+        `background_tasks` is given, inline otherwise.
+        
+        The body skips Pydantic entirely: every payload (fresh or cached) is
+        assembled from model dumps this app produced, so it is serialized
+        straight to JSON bytes with orjson.
+        
+        Responses carry `X-Cache` and a content `ETag`. As /analyze is a
+        POST, a matching `If-None-Match` ("only if changed") gets an empty
+        412 Precondition Failed rather than a 304 (RFC 7232 section 3.2).
+        
+        With `include_markdown=False` markdown file contents are returned as
+        null (metadata only); cache and storage still hold the full data.
+        
         Args:
             request: AnalyzeRequest with github_input
+            background_tasks: FastAPI background tasks for persistence
+            if_none_match: Value of the If-None-Match request header
+            include_markdown: Include markdown file contents in the body
             
         Returns:
-            AnalyzeResponse with user data and repositories
+            OrjsonResponse with the AnalyzeResponse body, or 412
         """
-        request_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        response_data = await AnalysisController._analyze(request, background_tasks)
+        cache_hit = response_data["cache_info"]["hit"]
+        etag = _etag(response_data)
+        if not include_markdown:
+            # Different representation, different validator
+            etag = etag[:-1] + '-nomd"'
+        headers = {
+            "X-Cache": "HIT" if cache_hit else "MISS",
+            "ETag": etag,
+        }
+        
+        if if_none_match and _etag_matches(if_none_match, etag):
+            # 304 is only for GET/HEAD; other methods fail the precondition
+            return Response(status_code=412, headers=headers)
+        
+        body = _response_body(response_data)
+        if not include_markdown:
+            body = _without_markdown_content(body)
+        return OrjsonResponse(body, headers=headers)
+    
+    @staticmethod
+    async def _analyze(
+        request: AnalyzeRequest,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Dict[str, Any]:
+        """
+        Resolve one analysis from cache or GitHub.
+        
+        Returns:
+            Response dict (AnalyzeResponse shape)
+        
+        Raises:
+            HTTPException: 400 invalid input/unknown user, 429 GitHub rate limit
+                (with Retry-After), 504 timeout, 500 otherwise
+        """
+        request_id = secrets.token_hex(4)
+        start_time = time.monotonic()
         
         try:
             # Step 1: Normalize input
             username, _ = normalize_github_input(request.github_input)
             logger.info(f"[{request_id}] Analyzing: {username}")
             
-            # Step 2: Check cache
-            cache_key = f"profile:{username.lower()}"
+            # Step 2: Check cache (username is already lowercased)
+            cache_key = f"profile:{username}"
             cached_data = await get_cache(cache_key)
             
             if cached_data:
                 logger.info(f"[{request_id}] [SUCCESS] Cache hit for {username}")
+                # Copy before patching: the in-process cache shares this dict across requests
+                cached_data = dict(cached_data)
                 cached_data["request_id"] = request_id
-                cached_data["timestamp"] = datetime.utcnow().isoformat()
-                cached_data["performance"]["cache_hit"] = True
+                cached_data["timestamp"] = utc_now_iso()
+                cached_data["performance"] = {**cached_data["performance"], "cache_hit": True}
                 cached_data["cache_info"] = {"hit": True}
+                # Entries cached before cached_at/ttl existed skip the refresh logic
+                cached_at, ttl = cached_data.get("cached_at"), cached_data.get("ttl")
+                if cached_at and ttl:
+                    age = time.time() - cached_at
+                    cached_data["performance"]["cache_ttl_remaining_seconds"] = max(0, int(ttl - age))
+                    if age > ttl * CACHE_SOFT_TTL_RATIO and not _analyze_flight.in_flight(cache_key):
+                        AnalysisController._schedule_refresh(username, cache_key, request_id)
+                record_cache_outcome(cached_data.get("activity_bucket"), hit=True)
                 # Ensure required fields exist (for backwards compatibility with old cache)
                 if "total_repos_analyzed" not in cached_data:
                     cached_data["total_repos_analyzed"] = len(cached_data.get("repositories", []))
                 if "total_api_calls" not in cached_data:
                     cached_data["total_api_calls"] = len(cached_data.get("repositories", [])) + 1
-                return AnalyzeResponse(**cached_data)
+                return cached_data
             
             logger.info(f"[{request_id}] Cache miss, fetching from GitHub...")
             
-            # Step 3: Fetch from GitHub
-            api_start = time.time()
-            
-            async with GitHubService() as github_service:
-                analysis = await github_service.analyze_profile(username)
-            
-            api_latency = int((time.time() - api_start) * 1000)
-            
-            # Step 4: Build response
-            user = UserData(
-                login=analysis["profile"].get("login"),
-                name=analysis["profile"].get("name"),
-                bio=analysis["profile"].get("bio"),
-                location=analysis["profile"].get("location"),
-                followers=analysis["profile"].get("followers", 0),
-                following=analysis["profile"].get("following", 0),
-                public_repos=analysis["profile"].get("public_repos", 0),
-                created_at=analysis["profile"].get("created_at", ""),
-                updated_at=analysis["profile"].get("updated_at", ""),
-                avatar_url=analysis["profile"].get("avatar_url", ""),
-                blog=analysis["profile"].get("blog"),
-                company=analysis["profile"].get("company"),
-            )
-            
-            repositories = [
-                RepositoryData(**repo)
-                for repo in analysis["repositories"]
-            ]
-            
-            total_time = time.time() - start_time
-            
-            performance = PerformanceMetrics(
-                github_api_latency_ms=api_latency,
-                processing_latency_ms=int((total_time - api_latency / 1000) * 1000),
-                total_latency_ms=int(total_time * 1000),
-                cache_hit=False,
-                cache_ttl_remaining_seconds=settings.CACHE_TTL_SECONDS,
+            # Steps 3-6, coalesced: concurrent misses for one user share a single fetch
+            response_data = await _analyze_flight.do(
+                cache_key,
+                lambda: AnalysisController._fetch_and_cache(
+                    username, cache_key, request_id, start_time, background_tasks
+                )
             )
+            if response_data["request_id"] != request_id:
+                logger.info(f"[{request_id}] [SUCCESS] Joined in-flight analysis for {username}")
+                response_data = {**response_data, "request_id": request_id}
+            # Counted here, per request that missed: background refreshes
+            # also run _fetch_and_cache, but their requests were cache hits
+            record_cache_outcome(response_data.get("activity_bucket"), hit=False)
             
-            response_data = {
-                "status": "success",
-                "request_id": request_id,
-                "timestamp": datetime.utcnow().isoformat(),
-                "user": user.dict(),
-                "repositories": [r.dict() for r in repositories],
-                "total_repos_analyzed": len(repositories),
-                "total_api_calls": len(repositories) + 1,  # 1 for user + 1 per repo
-                "performance": performance.dict(),
-                "cache_info": {"hit": False},
-                "data": {
-                    "user": analysis["profile"],
-                    "repositories": analysis["repositories"]
-                }
-            }
-            
-            # Step 5: Save to storage
-            storage_service.save_analysis(username, response_data)
-            
-            # Step 6: Cache result
-            await set_cache(cache_key, response_data)
-            
-            logger.info(f"[{request_id}] [SUCCESS] Analysis complete: {len(repositories)} repos, {total_time:.2f}s")
-            return AnalyzeResponse(**response_data)
+            return response_data
             
         except ValueError as e:
             logger.error(f"[{request_id}] [ERROR] Validation error: {e}")
             raise HTTPException(status_code=400, detail=str(e))
+        except RateLimitError as e:
+            logger.error(f"[{request_id}] [ERROR] {e}")
+            raise HTTPException(
+                status_code=429,
+                detail="GitHub rate limit reached, please retry later",
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"[{request_id}] [ERROR] GitHub fetch timed out after {ANALYZE_TIMEOUT_SECONDS}s")
+            raise HTTPException(status_code=504, detail="GitHub fetch timed out, please retry")
         except Exception as e:
             logger.error(f"[{request_id}] [ERROR] Analysis failed: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    
+    @staticmethod
+    async def analyze_batch(
+        request: BatchAnalyzeRequest,
+        background_tasks: Optional[BackgroundTasks] = None,
+        include_markdown: bool = True
+    ) -> OrjsonResponse:
+        """
+        Analyze several GitHub profiles in one call.
+        
+        Each username goes through the same cache/coalescing path as
+        `analyze_profile`; cache misses are fetched concurrently, within
+        the MAX_CONCURRENT_GH limit. A failure for one username doesn't
+        fail the batch.
+        
+        Args:
+            request: BatchAnalyzeRequest with github_inputs
+            background_tasks: FastAPI background tasks for persistence
+            include_markdown: Include markdown file contents in the bodies
+            
+        Returns:
+            OrjsonResponse with one AnalyzeResponse or ErrorResponse body per input, in input order
+        """
+        results = await asyncio.gather(
+            *(
+                AnalysisController._analyze(AnalyzeRequest(github_input=github_input), background_tasks)
+                for github_input in request.github_inputs
+            ),
+            return_exceptions=True
+        )
+        
+        responses = []
+        for github_input, result in zip(request.github_inputs, results):
+            if isinstance(result, HTTPException):
+                responses.append(ErrorResponse(
+                    error_code={400: "INVALID_INPUT", 429: "RATE_LIMITED", 504: "TIMEOUT"}.get(result.status_code, "ANALYSIS_FAILED"),
+                    error_message=f"{github_input}: {result.detail}"
+                ).model_dump())
+            elif isinstance(result, Exception):
+                responses.append(ErrorResponse(
+                    error_code="ANALYSIS_FAILED",
+                    error_message=f"{github_input}: {result}"
+                ).model_dump())
+            else:
+                body = _response_body(result)
+                responses.append(body if include_markdown else _without_markdown_content(body))
+        
+        return OrjsonResponse(responses)
+    
+    @staticmethod
+    def _schedule_refresh(username: str, cache_key: str, request_id: str):
+        """
+        Refetch a stale-but-valid entry without holding up the response.
+        
+        Goes through `_analyze_flight`, so it joins (rather than repeats) a
+        fetch already in flight; failures only log, the old entry stays cached.
+        """
+        async def refresh():
+            try:
+                await _analyze_flight.do(
+                    cache_key,
+                    lambda: AnalysisController._fetch_and_cache(username, cache_key, request_id, time.monotonic())
+                )
+            except Exception as e:
+                logger.warning(f"[{request_id}] Background refresh failed for {username}: {e}")
+        
+        logger.info(f"[{request_id}] Cache entry for {username} is stale, refreshing in background")
+        task = asyncio.ensure_future(refresh())
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+    
+    @staticmethod
+    async def _fetch_and_cache(
+        username: str,
+        cache_key: str,
+        request_id: str,
+        start_time: float,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a profile from GitHub, cache the response, and persist it.
+        
+        Runs once per username at a time (see `_analyze_flight`). The cache
+        is written before this returns, so the in-flight entry is only
+        dropped once later requests can hit the cache; only the storage
+        write is deferred to `background_tasks`.
+        
+        Returns:
+            Response dict (AnalyzeResponse shape)
+        """
+        # Step 3: Fetch from GitHub
+        github_service = await get_github_service()
+        api_start = time.monotonic()
+        
+        analysis = await _fetch_bounded(github_service, username)
+        
+        api_latency = int((time.monotonic() - api_start) * 1000)
+        
+        # Step 4: Build response
+        profile = analysis["profile"]
+        user = UserData(
+            login=profile.get("login"),
+            name=profile.get("name"),
+            bio=profile.get("bio"),
+            location=profile.get("location"),
+            followers=profile.get("followers", 0),
+            following=profile.get("following", 0),
+            public_repos=profile.get("public_repos", 0),
+            created_at=profile.get("created_at", ""),
+            updated_at=profile.get("updated_at", ""),
+            avatar_url=profile.get("avatar_url", ""),
+            blog=profile.get("blog"),
+            company=profile.get("company"),
+        )
+        
+        # Trusted server-built data: projected to the response shape, not re-validated
+        repo_dumps = [_repository_body(repo) for repo in analysis["repositories"]]
+        
+        total_time = time.monotonic() - start_time
+        
+        # Per-user TTL: dormant profiles stay cached longer than active ones
+        age = activity_age_seconds(profile, analysis["repositories"])
+        ttl = adaptive_ttl(profile, age)
+        
+        performance = PerformanceMetrics(
+            github_api_latency_ms=api_latency,
+            processing_latency_ms=int(total_time * 1000) - api_latency,
+            total_latency_ms=int(total_time * 1000),
+            cache_hit=False,
+            cache_ttl_remaining_seconds=ttl,
+        )
+        
+        user_dump = user.model_dump()
+        response_data = {
+            "status": "success",
+            "request_id": request_id,
+            "timestamp": utc_now_iso(),
+            "user": user_dump,
+            "repositories": repo_dumps,
+            "total_repos_analyzed": len(repo_dumps),
+            "total_api_calls": len(repo_dumps) + 1,  # 1 for user + 1 per repo
+            "performance": performance.model_dump(),
+            "cache_info": {"hit": False},
+            "etag": _profile_etag(user_dump, repo_dumps),
+            # Hit-rate stats per activity age, without re-parsing timestamps on hits
+            "activity_bucket": activity_bucket(age),
+        }
+        # Reports work from the raw GitHub data (dependency files etc.), so
+        # storage keeps that rather than the response dumps
+        raw_data = {"user": profile, "repositories": analysis["repositories"]}
+        
+        # Cache before the in-flight entry resolves, so requests arriving
+        # right after it (or after the first caller disconnects) hit the cache
+        await set_cache(cache_key, _cache_entry(response_data, ttl), ttl=ttl)
+        
+        # Step 5: Save to storage, off the response path when possible
+        if background_tasks is not None:
+            background_tasks.add_task(AnalysisController._persist, username, raw_data, request_id)
+        else:
+            await AnalysisController._persist(username, raw_data, request_id)
+        
+        logger.info(f"[{request_id}] [SUCCESS] Analysis complete: {len(repo_dumps)} repos, {total_time:.2f}s")
+        return response_data
+    
+    @staticmethod
+    async def _persist(username: str, raw_data: Dict[str, Any], request_id: str):
+        """Save the raw profile data to storage (in a worker thread)."""
+        try:
+            # Same layout as ReportController saves: {data: {user, repositories}}
+            await asyncio.to_thread(storage_service.save_analysis, username, {"data": raw_data})
+        except Exception as e:
+            logger.warning(f"[{request_id}] Failed to save: {e}")
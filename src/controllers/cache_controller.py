@@ -0,0 +1,74 @@
+"""
+Cache Controller
+
+Handles HTTP requests for cache maintenance.
+Delegates storage details to the cache service.
+"""
+from typing import Any, Dict
+
+from fastapi import HTTPException
+from services.cache_service import clear_all_cache, clear_cache_by_key, get_cache_stats
+from utils.validators import normalize_github_input
+from utils.logger import logger
+
+
+class CacheController:
+    """
+    Controller for cache management endpoints.
+
+    Responsibilities:
+    - Validate usernames for per-user invalidation
+    - Delegate to the cache service (both tiers)
+    - Report cache hit rates
+    """
+
+    @staticmethod
+    async def stats() -> Dict[str, Any]:
+        """
+        Rolling /analyze cache hit-rate per activity-age bucket (this worker).
+
+        Returns:
+            Status and {bucket: hit-rate EWMA}
+        """
+        return {
+            "status": "success",
+            "hit_rate_by_activity_age": get_cache_stats()
+        }
+
+    @staticmethod
+    async def clear_all() -> Dict[str, str]:
+        """
+        Clear every cached analysis.
+
+        Returns:
+            Status message
+        """
+        await clear_all_cache()
+        logger.info("[CACHE] Cleared all entries")
+        return {
+            "status": "success",
+            "message": "Cache cleared successfully"
+        }
+
+    @staticmethod
+    async def clear_user(github_input: str) -> Dict[str, str]:
+        """
+        Clear the cached analysis for one user.
+
+        Args:
+            github_input: GitHub username or profile URL
+
+        Returns:
+            Status message
+        """
+        try:
+            username, _ = normalize_github_input(github_input)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        await clear_cache_by_key(f"profile:{username}")
+        logger.info(f"[CACHE] Cleared entry for {username}")
+        return {
+            "status": "success",
+            "message": f"Cache cleared for {username}"
+        }
@@ -4,14 +4,24 @@ Report Controller
 Handles HTTP requests for generating analysis reports.
 Delegates business logic to AnalysisService.
 """
-import uuid
-from typing import Dict, Any
+import secrets
+import asyncio
+from typing import Dict, Any, Optional
 
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 from models.schemas import ReportRequest
-from services.github_service import GitHubService
+from services.github_service import get_github_service
 from services.storage_service import storage_service
+from services.cache_service import clear_cache_by_key
+from core.exceptions import RateLimitError
 from utils.logger import logger
+from utils.responses import OrjsonResponse
+from utils.validators import normalize_github_input
+from utils.singleflight import SingleFlight
+
+
+# In-flight report builds keyed by (username, report_type, use_stored)
+_report_flight = SingleFlight()
 
 
 class ReportController:
@@ -25,7 +35,10 @@ class ReportController:
     """
     
     @staticmethod
-    async def generate_report(request: ReportRequest) -> Dict[str, Any]:
+    async def generate_report(
+        request: ReportRequest,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> OrjsonResponse:
         """
         Generate comprehensive analysis report.
         
@@ -34,82 +47,131 @@ class ReportController:
         2. Delegate to AnalysisService for report generation
         3. Return formatted report
         
+        Storage files are read in a worker thread; freshly fetched data is
+        saved after the response is sent when `background_tasks` is given.
+        
+        The report is plain JSON types, so it goes straight to orjson;
+        returning the dict would run FastAPI's jsonable_encoder over it first
+        (~50x the cost of the encode itself).
+        
         Args:
             request: ReportRequest with username, report_type, use_stored
+            background_tasks: FastAPI background tasks for persistence
             
         Returns:
-            Dict with comprehensive analysis report
+            OrjsonResponse with the comprehensive analysis report
         """
-        # Import here to avoid circular dependency
-        from services.analysis_service import analysis_service
-        
-        request_id = str(uuid.uuid4())[:8]
+        request_id = secrets.token_hex(4)
         
         try:
-            username = request.username
+            # Same normalization as /analyze, so both share storage and cache keys
+            username, _ = normalize_github_input(request.username)
             report_type = request.report_type
             use_stored = request.use_stored
             
             logger.info(f"[{request_id}] Generating {report_type} report for {username}")
             
-            # Step 1: Get data (from storage or fresh analysis)
-            data = None
-            data_source = "unknown"
-            
-            if use_stored:
-                # Try to load from storage first
-                stored = storage_service.load_analysis(username)
-                if stored:
-                    # Extract the actual data from nested structure
-                    stored_data = stored.get("data", {})
-                    # Handle both old and new storage formats
-                    if "data" in stored_data:
-                        # New format: {data: {data: {user, repositories}}}
-                        data = stored_data.get("data")
-                    else:
-                        # Old format: {data: {user, repositories}}
-                        data = stored_data
-                    
-                    data_source = "stored_json"
-                    logger.info(f"[{request_id}] Using stored data")
-            
-            # If no stored data, analyze fresh
-            if not data:
-                logger.info(f"[{request_id}] No stored data, analyzing fresh...")
-                async with GitHubService() as github_service:
-                    analysis = await github_service.analyze_profile(username)
-                
-                # Build data structure
-                user_data = {
-                    "user": analysis["profile"],
-                    "repositories": analysis["repositories"]
-                }
-                data = user_data
-                data_source = "fresh_analysis"
-                
-                # Save to storage for future use
-                try:
-                    storage_service.save_analysis(username, {"data": data})
-                    logger.info(f"[{request_id}] [SUCCESS] Saved to db/{username}.json")
-                except Exception as e:
-                    logger.warning(f"[{request_id}] Failed to save: {e}")
-            
-            # Step 2: Generate deterministic analysis report
-            logger.info(f"[{request_id}] Generating deterministic analysis report...")
-            report = analysis_service.generate_report(data, report_type)
+            # Identical concurrent report requests share one build
+            report = await _report_flight.do(
+                (username, report_type, use_stored),
+                lambda: ReportController._build_report(
+                    username, report_type, use_stored, request_id, background_tasks
+                )
+            )
             
-            # Add metadata
-            report["request_id"] = request_id
-            report["data_source"] = data_source
+            # Add metadata (copy: joined callers share the report dict)
+            report = {**report, "request_id": request_id}
             
             logger.info(f"[{request_id}] [SUCCESS] Report generated successfully")
             
-            return report
+            return OrjsonResponse(report)
             
         except ValueError as e:
             logger.error(f"[{request_id}] Validation error: {e}")
             raise HTTPException(status_code=400, detail=str(e))
         
+        except RateLimitError as e:
+            logger.error(f"[{request_id}] {e}")
+            raise HTTPException(
+                status_code=429,
+                detail="GitHub rate limit reached, please retry later",
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        
         except Exception as e:
             logger.error(f"[{request_id}] Report generation failed: {e}")
             raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
+    
+    @staticmethod
+    async def _build_report(
+        username: str,
+        report_type: str,
+        use_stored: bool,
+        request_id: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Dict[str, Any]:
+        """
+        Load (or fetch) profile data and generate the report.
+        
+        Runs once per (username, report_type, use_stored) at a time.
+        
+        Returns:
+            Report dict without per-request metadata
+        """
+        # Import here to avoid circular dependency
+        from services.analysis_service import analysis_service
+        
+        # Step 1: Get data (from storage or fresh analysis)
+        data = None
+        data_source = "unknown"
+        
+        if use_stored:
+            # Try to load from storage first
+            stored = await asyncio.to_thread(storage_service.load_analysis, username)
+            if stored:
+                # Storage layout: {data: {data: {user, repositories}}} (legacy files are migrated on load)
+                data = (stored.get("data") or {}).get("data")
+                
+                data_source = "stored_json"
+                logger.info(f"[{request_id}] Using stored data")
+        
+        # If no stored data, analyze fresh
+        if not data:
+            logger.info(f"[{request_id}] No stored data, analyzing fresh...")
+            github_service = await get_github_service()
+            analysis = await github_service.analyze_profile(username)
+            
+            # Build data structure
+            user_data = {
+                "user": analysis["profile"],
+                "repositories": analysis["repositories"]
+            }
+            data = user_data
+            data_source = "fresh_analysis"
+            
+            # Save to storage for future use, off the response path when possible
+            if background_tasks is not None:
+                background_tasks.add_task(ReportController._save, username, data, request_id)
+            else:
+                await ReportController._save(username, data, request_id)
+            
+            # Fresh data supersedes any cached /analyze response
+            await clear_cache_by_key(f"profile:{username}")
+        
+        # Step 2: Generate deterministic analysis report
+        logger.info(f"[{request_id}] Generating deterministic analysis report...")
+        report = analysis_service.generate_report(data, report_type)
+        
+        # Add metadata
+        report["data_source"] = data_source
+        
+        return report
+    
+    @staticmethod
+    async def _save(username: str, data: Dict[str, Any], request_id: str):
+        """Save fetched profile data to storage (in a worker thread)."""
+        try:
+            await asyncio.to_thread(storage_service.save_analysis, username, {"data": data})
+            logger.info(f"[{request_id}] [SUCCESS] Saved to db/{username}.json")
+        except Exception as e:
+            logger.warning(f"[{request_id}] Failed to save: {e}")
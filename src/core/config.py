@@ -1,7 +1,8 @@
 """Configuration loader from environment variables"""
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
-from typing import Optional
+from dataclasses import make_dataclass
+from typing import Final, Optional, Tuple
 from pathlib import Path
 
 
@@ -16,15 +17,31 @@ class Settings(BaseSettings):
     GITHUB_APP_ID: int
     GITHUB_PRIVATE_KEY: str
     GITHUB_INSTALLATION_ID: int
+    GITHUB_EXTRA_INSTALLATION_IDS: str = ""  # Comma-separated further installations of the same App (quotas are pooled)
     
     # Service Configuration
     MAX_REPOS_PER_USER: int = 15
+    MAX_README_BYTES: int = 102400  # README text kept per repo; longer ones are truncated
     CACHE_TTL_SECONDS: int = 86400  # 24 hours default
-    API_TIMEOUT_SECONDS: int = 10
+    CACHE_MIN_TTL_SECONDS: int = 3600  # Adaptive TTL floor (very active profiles)
+    CACHE_MAX_TTL_SECONDS: int = 604800  # Adaptive TTL ceiling (dormant profiles, 7 days)
+    CACHE_SOFT_TTL_RATIO: float = 0.75  # Past this share of its TTL a hit is served and refreshed in the background (>= 1 disables)
+    API_TIMEOUT_SECONDS: int = 10  # Per GitHub HTTP request
+    ANALYZE_TIMEOUT_SECONDS: int = 30  # Whole profile analysis (dozens of GitHub calls), excluding the wait for a fetch slot
+    MAX_CONCURRENT_GH: int = 50  # Profile fetches allowed in flight at once (tune from p95)
+    RATE_LIMIT_PER_MINUTE: int = 60  # Analyze requests per client IP per minute (0 disables)
+    RATE_LIMIT_CLIENT_HEADER: str = ""  # Header the reverse proxy sets to the client IP (e.g. X-Forwarded-For); empty: peer address
+    CORS_ALLOWED_ORIGINS: str = "*"  # Comma-separated browser origins allowed to call the API ("*" for any)
     LOG_LEVEL: str = "INFO"
     PORT: int = 8000
     ENVIRONMENT: str = "production"
     
+    # Cache Configuration
+    REDIS_URL: Optional[str] = None  # e.g. redis://localhost:6379/0 (file cache when unset)
+    LOCAL_CACHE_MAXSIZE: int = 1024  # In-process LRU entries in front of Redis/file cache
+    LOCAL_CACHE_TTL_SECONDS: int = 30  # Short TTL keeps workers from serving stale data long
+    FILE_CACHE_MAX_ENTRIES: int = 10000  # LRU cap on file cache entries (ignored with Redis)
+    
     # LLM Configuration (Optional - for AI Reports)
     # Ollama (Local LLM - Zero Cost)
     USE_OLLAMA: bool = False  # Set to True to use local Ollama instead of cloud APIs
@@ -47,7 +64,32 @@ class Settings(BaseSettings):
     )
 
 
-# Load settings once at startup
-settings = Settings()
+# Frozen, slotted mirror of Settings, and the only way the app reads
+# configuration (per request too): plain slot reads instead of BaseSettings
+# attribute access. Configuration is fixed per process; change the
+# environment / .env and restart to change it.
+SettingsSnapshot = make_dataclass(
+    "SettingsSnapshot",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+
+# Load settings once at import
+settings: Final = SettingsSnapshot(**Settings().model_dump())
+
+# Values read per request, also as plain module constants
+CACHE_TTL_SECONDS: Final[int] = settings.CACHE_TTL_SECONDS
+CACHE_SOFT_TTL_RATIO: Final[float] = settings.CACHE_SOFT_TTL_RATIO
+API_TIMEOUT_SECONDS: Final[int] = settings.API_TIMEOUT_SECONDS
+ANALYZE_TIMEOUT_SECONDS: Final[int] = settings.ANALYZE_TIMEOUT_SECONDS
+MAX_REPOS_PER_USER: Final[int] = settings.MAX_REPOS_PER_USER
+MAX_README_BYTES: Final[int] = settings.MAX_README_BYTES
+GITHUB_INSTALLATION_ID: Final[int] = settings.GITHUB_INSTALLATION_ID
+GITHUB_INSTALLATION_IDS: Final[Tuple[int, ...]] = (
+    GITHUB_INSTALLATION_ID,
+    *(int(i) for i in settings.GITHUB_EXTRA_INSTALLATION_IDS.split(",") if i.strip())
+)
+ENVIRONMENT: Final[str] = settings.ENVIRONMENT
 
 print(f"[OK] Settings loaded: App ID {settings.GITHUB_APP_ID}, Installation {settings.GITHUB_INSTALLATION_ID}")
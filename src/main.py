@@ -25,7 +25,10 @@ import uvicorn
 
 from core.config import settings
 from api.routes import router
+from services.cache_service import init_cache, close_cache
+from services.github_service import init_github_service, close_github_service
 from utils.logger import logger
+from utils.responses import OrjsonResponse
 
 
 # ============= APPLICATION LIFECYCLE =============
@@ -37,6 +40,8 @@ async def lifespan(app: FastAPI):
     
     Handles:
     - Service initialization logging
+    - Cache backend connection (Redis or file fallback)
+    - Shared GitHub session warm-up (installation token + connection pool)
     - Resource cleanup on shutdown
     - Health check status updates
     """
@@ -51,10 +56,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"[LINK] Swagger Docs: http://localhost:{settings.PORT}/docs")
     logger.info("=" * 60)
     
+    await init_cache()
+    app.state.github = await init_github_service()
+    
     yield  # Server runs here
     
     # Shutdown: Cleanup resources
     logger.info("🛑 Server shutting down...")
+    await close_github_service()
+    await close_cache()
 
 
 # ============= FASTAPI APPLICATION SETUP =============
@@ -90,6 +100,9 @@ POST /api/v1/reports/generate {"username": "torvalds"}
     version="1.0.0",
     lifespan=lifespan,
     
+    # Endpoints returning plain dicts (reports, cache admin) serialize with orjson
+    default_response_class=OrjsonResponse,
+    
     # API Documentation URLs
     docs_url="/docs",          # Swagger UI
     redoc_url="/redoc",        # ReDoc alternative
@@ -114,10 +127,13 @@ POST /api/v1/reports/generate {"username": "torvalds"}
 
 # ============= CORS MIDDLEWARE =============
 
+# The API uses no cookies or browser credentials, so none are allowed:
+# with a wildcard origin Starlette can then answer with a static
+# "Access-Control-Allow-Origin: *" instead of echoing each request's Origin
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Set to specific domains in production
-    allow_credentials=True,
+    allow_origins=[o.strip() for o in settings.CORS_ALLOWED_ORIGINS.split(",") if o.strip()],
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -176,6 +192,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",  # Listen on all available network interfaces
         port=settings.PORT,
+        loop="auto",  # uvloop when installed (uvicorn[standard]; not on Windows)
+        http="auto",  # httptools when installed (uvicorn[standard])
         reload=settings.ENVIRONMENT == "development",  # Hot reload in dev mode
         log_level=settings.LOG_LEVEL.lower(),
         access_log=settings.ENVIRONMENT != "test"  # Disable access logs in tests
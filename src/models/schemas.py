@@ -5,11 +5,15 @@ This module defines all data models for the GitHub User Data Analyzer API.
 Models are used for request validation, response serialization, and 
 automatic Swagger UI documentation generation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional, Annotated
 from datetime import datetime
 
 
+# Counts and sizes; GitHub never reports these negative
+NonNegInt = Annotated[int, Field(ge=0)]
+
+
 # ============= INPUT MODELS =============
 
 class AnalyzeRequest(BaseModel):
@@ -30,6 +34,24 @@ class AnalyzeRequest(BaseModel):
     ]
 
 
+class BatchAnalyzeRequest(BaseModel):
+    """
+    Request model for analyzing several GitHub profiles in one call.
+    
+    Each entry accepts the same formats as `AnalyzeRequest.github_input`.
+    Results are returned in the same order as the inputs.
+    """
+    github_inputs: Annotated[
+        List[Annotated[str, Field(min_length=1, max_length=100)]],
+        Field(
+            min_length=1,
+            max_length=32,
+            description="GitHub usernames or profile URLs (max 32)",
+            examples=[["torvalds", "https://github.com/octocat"]]
+        )
+    ]
+
+
 class ReportRequest(BaseModel):
     """
     Request model for AI-powered candidate report generation.
@@ -105,6 +127,7 @@ This is the GitHub username (not URL) of the developer you want to assess.""",
     ] = True
     
     model_config = {
+        "defer_build": True,  # Built when the /report route is registered
         "json_schema_extra": {
             "examples": [
                 {
@@ -123,6 +146,7 @@ This is the GitHub username (not URL) of the developer you want to assess.""",
 
 
 # ============= OUTPUT MODELS =============
+# Built once per response and never modified, hence frozen.
 
 class UserData(BaseModel):
     """
@@ -131,13 +155,15 @@ class UserData(BaseModel):
     Contains comprehensive information about a GitHub user including
     their public profile details, social metrics, and account metadata.
     """
+    model_config = ConfigDict(frozen=True)
+    
     login: str = Field(..., description="GitHub username", examples=["torvalds"])
     name: Optional[str] = Field(None, description="Full name", examples=["Linus Torvalds"])
     bio: Optional[str] = Field(None, description="User bio/description", examples=["Creator of Linux"])
     location: Optional[str] = Field(None, description="Geographic location", examples=["Portland, OR"])
-    followers: int = Field(..., description="Number of followers", examples=[250000])
-    following: int = Field(..., description="Number of users following", examples=[50])
-    public_repos: int = Field(..., description="Number of public repositories", examples=[5])
+    followers: NonNegInt = Field(..., description="Number of followers", examples=[250000])
+    following: NonNegInt = Field(..., description="Number of users following", examples=[50])
+    public_repos: NonNegInt = Field(..., description="Number of public repositories", examples=[5])
     created_at: str = Field(..., description="Account creation timestamp (ISO 8601)")
     updated_at: str = Field(..., description="Last profile update timestamp (ISO 8601)")
     avatar_url: str = Field(..., description="Profile picture URL")
@@ -152,6 +178,8 @@ class LanguageStats(BaseModel):
     Provides both raw byte counts and calculated percentages for all
     programming languages detected in the repository.
     """
+    model_config = ConfigDict(frozen=True)
+    
     raw_bytes: Dict[str, int] = Field(
         ..., 
         description="Raw byte count per language",
@@ -171,10 +199,15 @@ class MarkdownFile(BaseModel):
     Represents a single .md file found in the repository with its
     complete content (no truncation, all words included).
     """
+    model_config = ConfigDict(frozen=True)
+    
     filename: str = Field(..., description="Markdown filename", examples=["CONTRIBUTING.md"])
     path: str = Field(..., description="Full path in repository", examples=["docs/CONTRIBUTING.md"])
-    content: str = Field(..., description="Complete markdown file content (100% of text)")
-    length_chars: int = Field(..., description="Character count", examples=[2450])
+    content: Optional[str] = Field(
+        None,
+        description="Complete markdown file content (100% of text); null when requested with include_markdown=false"
+    )
+    length_chars: NonNegInt = Field(..., description="Character count", examples=[2450])
 
 
 class ReadmeInfo(BaseModel):
@@ -184,11 +217,13 @@ class ReadmeInfo(BaseModel):
     Contains the complete README content along with metadata about
     its presence and length for quality assessment.
     """
+    model_config = ConfigDict(frozen=True)
+    
     content: Optional[str] = Field(
         None, 
         description="Full README content in markdown format"
     )
-    length_chars: int = Field(..., description="Character count of README", examples=[5234])
+    length_chars: NonNegInt = Field(..., description="Character count of README", examples=[5234])
     has_readme: bool = Field(..., description="Whether repository has a README file", examples=[True])
 
 
@@ -200,6 +235,8 @@ class RepositoryData(BaseModel):
     assessment: technical skills (languages), activity level (commits), code quality
     (stars/forks), and professional practices (documentation, organization).
     """
+    model_config = ConfigDict(frozen=True)
+    
     # Basic Information
     name: str = Field(..., description="Repository name", examples=["linux"])
     full_name: str = Field(..., description="Full repository name with owner", examples=["torvalds/linux"])
@@ -207,13 +244,13 @@ class RepositoryData(BaseModel):
     html_url: str = Field(..., description="Repository URL", examples=["https://github.com/torvalds/linux"])
     
     # Popularity Metrics (for quality assessment)
-    stargazers_count: int = Field(..., description="Number of stars", examples=[180000])
-    forks_count: int = Field(..., description="Number of forks", examples=[60000])
-    watchers_count: int = Field(0, description="Number of watchers", examples=[180000])
-    open_issues_count: int = Field(0, description="Number of open issues", examples=[1245])
+    stargazers_count: NonNegInt = Field(..., description="Number of stars", examples=[180000])
+    forks_count: NonNegInt = Field(..., description="Number of forks", examples=[60000])
+    watchers_count: NonNegInt = Field(0, description="Number of watchers", examples=[180000])
+    open_issues_count: NonNegInt = Field(0, description="Number of open issues", examples=[1245])
     
     # Repository Metadata
-    size_kb: int = Field(..., description="Repository size in kilobytes", examples=[1048576])
+    size_kb: NonNegInt = Field(..., description="Repository size in kilobytes", examples=[1048576])
     language: Optional[str] = Field(None, description="Primary programming language", examples=["Python"])
     topics: List[str] = Field(..., description="Repository topics/tags", examples=[["machine-learning", "python"]])
     archived: bool = Field(..., description="Whether repository is archived", examples=[False])
@@ -232,7 +269,7 @@ class RepositoryData(BaseModel):
         description="Most recent commit timestamp (same as pushed_at)",
         examples=["2025-12-30T13:31:35Z"]
     )
-    days_since_last_commit: Optional[int] = Field(
+    days_since_last_commit: Optional[NonNegInt] = Field(
         None, 
         description="Days since last commit (for activity freshness)",
         examples=[1]
@@ -258,11 +295,13 @@ class PerformanceMetrics(BaseModel):
     Provides transparency into response times and cache effectiveness
     for monitoring and optimization purposes.
     """
-    github_api_latency_ms: int = Field(..., description="Time spent on GitHub API calls (ms)", examples=[850])
-    processing_latency_ms: int = Field(..., description="Time spent processing data (ms)", examples=[200])
-    total_latency_ms: int = Field(..., description="Total response time (ms)", examples=[1050])
+    model_config = ConfigDict(frozen=True)
+    
+    github_api_latency_ms: NonNegInt = Field(..., description="Time spent on GitHub API calls (ms)", examples=[850])
+    processing_latency_ms: NonNegInt = Field(..., description="Time spent processing data (ms)", examples=[200])
+    total_latency_ms: NonNegInt = Field(..., description="Total response time (ms)", examples=[1050])
     cache_hit: bool = Field(..., description="Whether response was served from cache", examples=[False])
-    cache_ttl_remaining_seconds: int = Field(..., description="Seconds until cache expires", examples=[86400])
+    cache_ttl_remaining_seconds: NonNegInt = Field(..., description="Seconds until cache expires", examples=[86400])
 
 
 class AnalyzeResponse(BaseModel):
@@ -277,13 +316,15 @@ class AnalyzeResponse(BaseModel):
     
     Perfect for job portal candidate assessment and AI-powered analysis.
     """
+    model_config = ConfigDict(frozen=True)
+    
     status: str = Field(..., description="Response status", examples=["success"])
     request_id: str = Field(..., description="Unique request identifier", examples=["a3f8b2c1"])
     timestamp: str = Field(..., description="Response timestamp (ISO 8601)")
     user: UserData = Field(..., description="GitHub user profile data")
     repositories: List[RepositoryData] = Field(..., description="List of analyzed repositories (top 15 by stars)")
-    total_repos_analyzed: int = Field(..., description="Number of repositories analyzed", examples=[15])
-    total_api_calls: int = Field(..., description="Number of GitHub API calls made", examples=[32])
+    total_repos_analyzed: NonNegInt = Field(..., description="Number of repositories analyzed", examples=[15])
+    total_api_calls: NonNegInt = Field(..., description="Number of GitHub API calls made", examples=[32])
     performance: PerformanceMetrics = Field(..., description="Performance metrics")
     cache_info: Dict[str, bool] = Field(..., description="Cache hit information", examples=[{"hit": False}])
 
@@ -317,6 +358,8 @@ class HealthResponse(BaseModel):
 
 
 # ============= ENHANCED REPORT MODELS =============
+# Not on the /analyze path: schemas are built on first use (defer_build),
+# not at import.
 
 class Technology(BaseModel):
     """
@@ -325,10 +368,12 @@ class Technology(BaseModel):
     Represents a single technology (language, framework, tool, or platform)
     with objective metrics about its usage across repositories.
     """
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     name: str = Field(..., description="Technology name", examples=["Python", "React", "Docker"])
     category: str = Field(..., description="Technology category", examples=["language", "framework", "tool", "platform"])
     usage_percentage: float = Field(..., description="Percentage of total codebase", examples=[45.2])
-    repository_count: int = Field(..., description="Number of repositories using this technology", examples=[8])
+    repository_count: NonNegInt = Field(..., description="Number of repositories using this technology", examples=[8])
     recent_usage: bool = Field(..., description="Used in repositories updated within last 6 months", examples=[True])
     example_repositories: List[str] = Field(..., description="Example repositories using this technology", examples=[["repo1", "repo2"]])
 
@@ -339,6 +384,8 @@ class TechnologyAnalysis(BaseModel):
     
     Aggregates all technologies used across repositories with usage metrics.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     technologies: List[Technology] = Field(..., description="All technologies with usage data")
     primary_stack: List[str] = Field(..., description="Main technologies (>20% usage)", examples=[["Python", "JavaScript"]])
     secondary_stack: List[str] = Field(..., description="Supporting technologies", examples=[["Docker", "PostgreSQL"]])
@@ -351,8 +398,10 @@ class ComplexityIndicators(BaseModel):
     
     Provides factual indicators of project complexity and quality.
     """
-    repository_size_kb: int = Field(..., description="Repository size in kilobytes", examples=[1500])
-    stars: int = Field(..., description="GitHub stars count", examples=[120])
+    model_config = ConfigDict(defer_build=True)
+    
+    repository_size_kb: NonNegInt = Field(..., description="Repository size in kilobytes", examples=[1500])
+    stars: NonNegInt = Field(..., description="GitHub stars count", examples=[120])
     has_documentation: bool = Field(..., description="Has README or documentation", examples=[True])
     has_tests_indicated: bool = Field(..., description="Indicates presence of tests", examples=[True])
 
@@ -363,6 +412,8 @@ class ProjectScope(BaseModel):
     
     Provides business context and technical details about a specific project.
     """
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     repository_name: str = Field(..., description="Repository name", examples=["ecommerce-platform"])
     business_domain: str = Field(..., description="Business/industry domain", examples=["E-commerce", "Healthcare", "Finance"])
     project_type: str = Field(..., description="Type of project", examples=["Web App", "Mobile App", "API", "Library"])
@@ -379,6 +430,8 @@ class Skill(BaseModel):
     
     Represents a skill with factual evidence of usage.
     """
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     name: str = Field(..., description="Skill name", examples=["Python", "Docker", "Documentation"])
     usage_percentage: Optional[float] = Field(None, description="Usage percentage (for languages)", examples=[45.2])
     category: Optional[str] = Field(None, description="Skill category", examples=["language", "tool", "soft_skill"])
@@ -391,6 +444,8 @@ class ComprehensiveSkills(BaseModel):
     
     Categorizes all skills extracted from repositories.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     programming_languages: List[Skill] = Field(..., description="Programming languages with usage data")
     frameworks_and_libraries: List[Skill] = Field(..., description="Frameworks and libraries used")
     tools_and_platforms: List[Skill] = Field(..., description="Tools and platforms (Docker, AWS, CI/CD, etc.)")
@@ -404,6 +459,8 @@ class DomainClassification(BaseModel):
     
     Classifies developer's industry expertise based on project types and technologies.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     primary_domain: str = Field(..., description="Primary industry domain", examples=["Healthcare", "Finance", "E-commerce"])
     secondary_domains: List[str] = Field(..., description="Secondary industry domains", examples=[["Education", "Marketing"]])
     specializations: List[str] = Field(..., description="Specialization areas within domains", examples=[["Medical Imaging", "Patient Management"]])
@@ -8,18 +8,6 @@ Sub-packages:
 - analyzers: GitHub profile analysis engines
 """
 
-from modules.analyzers import (
-    domain_classifier,
-    tech_analyzer,
-    scoring_engine,
-    role_recommender,
-    dependency_parser
-)
-
-__all__ = [
-    'domain_classifier',
-    'tech_analyzer',
-    'scoring_engine',
-    'role_recommender',
-    'dependency_parser'
-]
+# No re-exports: importing this package stays cheap. Import analyzers
+# from their own modules, e.g.
+#   from modules.analyzers.tech_analyzer import tech_analyzer
@@ -12,18 +12,10 @@ Analyzers:
 - dependency_parser: Parse dependency manifest files
 """
 
-from modules.analyzers.domain_classifier import domain_classifier
-from modules.analyzers.tech_analyzer import tech_analyzer
-from modules.analyzers.scoring_engine import scoring_engine
-from modules.analyzers.role_recommender import role_recommender
-from modules.analyzers.dependency_parser import dependency_parser
-from modules.analyzers.readme_analyzer import readme_analyzer
-
-__all__ = [
-    'domain_classifier',
-    'tech_analyzer',
-    'scoring_engine',
-    'role_recommender',
-    'dependency_parser',
-    'readme_analyzer'
-]
+# No re-exports. Each analyzer builds its singleton (keyword tables,
+# compiled patterns) at import, so importing one analyzer - or the
+# package - must not pull in all of them. The singletons also share their
+# submodule's name, which rules out lazy (PEP 562) re-exports: once the
+# submodule is imported, the package attribute is the module object.
+# Import from the analyzer's own module:
+#   from modules.analyzers.tech_analyzer import tech_analyzer
@@ -4,11 +4,17 @@ Domain Classification Module
 Handles domain detection and weighted scoring for GitHub repositories.
 Uses keyword matching with configurable weights to prioritize specialized domains.
 """
-import re
 from typing import Dict, List, Tuple
 from collections import Counter
+from functools import lru_cache
 from utils.logger import logger
-from config.keywords_config import get_domain_keywords, get_domain_weights
+from config.keywords_config import (
+    get_domain_keywords, get_domain_weights, get_domain_keyword_index, get_domain_columns
+)
+from modules.analyzers.keyword_matcher import KeywordMatcher
+
+# Distinct texts whose scores are remembered (see classify_text)
+CLASSIFY_CACHE_SIZE = 8192
 
 
 class DomainClassifier:
@@ -25,7 +31,18 @@ class DomainClassifier:
         """Initialize classifier with domain keywords and weights."""
         self.domain_keywords = get_domain_keywords()
         self.domain_weights = get_domain_weights()
-        logger.info(f"[TAG]  Domain Classifier initialized with {len(self.domain_keywords)} domains")
+        self.keyword_index = get_domain_keyword_index()
+        # Parallel columns indexed by domain id (position in configured order)
+        self.domain_names, self.domain_weight_values, self.keyword_domain_ids = get_domain_columns()
+        self.matcher = KeywordMatcher(self.keyword_index)
+        # Memoized per instance: one analysis scores each description several
+        # times, and re-analyses see the same texts again.
+        # Hit/miss counts: domain_classifier.classify_text.cache_info()
+        self.classify_text = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self.classify_text)
+        logger.info(
+            f"[TAG]  Domain Classifier initialized with {len(self.domain_keywords)} domains, "
+            f"{len(self.keyword_index)} distinct keywords ({self.matcher.backend} matcher)"
+        )
     
     def classify_repository(self, repo: Dict) -> Tuple[str, float]:
         """
@@ -90,38 +107,40 @@ class DomainClassifier:
         Returns:
             Dict mapping domain names to weighted scores
         """
-        domain_scores = {}
-        
-        for domain, keywords in self.domain_keywords.items():
-            match_count = self._count_keyword_matches(text, keywords)
-            
-            if match_count > 0:
-                weight = self.domain_weights.get(domain, 1.0)
-                weighted_score = match_count * weight
-                domain_scores[domain] = weighted_score
-        
-        return domain_scores
+        return dict(self.classify_text(text))
     
-    def _count_keyword_matches(self, text: str, keywords: List[str]) -> int:
+    def classify_text(self, text: str) -> Tuple[Tuple[str, float], ...]:
         """
-        Count how many keywords match in the text.
+        Score text against every domain (memoized, hence the immutable result).
         
-        Uses word boundary matching for short keywords (<4 chars),
-        substring matching for longer keywords.
+        Args:
+            text: Lowercase text to search
+            
+        Returns:
+            Tuple of (domain, weighted_score) pairs in configured domain order
         """
-        match_count = 0
+        matched = self.matcher.find(text)
+        if not matched:
+            return ()
+        
+        match_counts = [0] * len(self.domain_names)
+        
+        # One pass finds every keyword, each credited to all domains listing it
+        for keyword in matched:
+            for domain_id in self.keyword_domain_ids[keyword]:
+                match_counts[domain_id] += 1
         
-        for keyword in keywords:
-            if len(keyword) < 4:
-                # Short keywords need exact word match
-                if re.search(r'\b' + re.escape(keyword) + r'\b', text):
-                    match_count += 1
-            else:
-                # Longer keywords can use substring match
-                if keyword in text:
-                    match_count += 1
+        # Integer counts get their weight applied once, in configured domain
+        # order so score ties resolve the same way
+        domain_scores = [
+            (domain, match_count * weight)
+            for domain, weight, match_count in zip(
+                self.domain_names, self.domain_weight_values, match_counts
+            )
+            if match_count
+        ]
         
-        return match_count
+        return tuple(domain_scores)
 
 
 # Singleton instance for easy import
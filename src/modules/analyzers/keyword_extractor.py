@@ -17,7 +17,6 @@ And produces ranked keywords in three categories:
 3. Feature Keywords (project capabilities)
 """
 
-import re
 from typing import Dict, List, Set, Tuple, Optional
 from collections import Counter
 from dataclasses import dataclass
@@ -160,7 +159,7 @@ class KeywordExtractor:
             frequency = 0
             
             for source_name, text in text_sources.items():
-                if pattern in text or self._word_boundary_match(pattern, text):
+                if pattern in text:
                     sources_found.append(source_name)
                     frequency += 1
             
@@ -188,7 +187,7 @@ class KeywordExtractor:
             frequency = 0
             
             for source_name, text in text_sources.items():
-                if pattern in text or self._word_boundary_match(pattern, text):
+                if pattern in text:
                     sources_found.append(source_name)
                     frequency += 1
             
@@ -220,7 +219,7 @@ class KeywordExtractor:
             frequency = 0
             
             for source_name, text in text_sources.items():
-                if pattern in text or self._word_boundary_match(pattern, text):
+                if pattern in text:
                     sources_found.append(source_name)
                     frequency += 1
             
@@ -250,13 +249,6 @@ class KeywordExtractor:
         ranked = sorted(unique.values(), key=lambda k: (k.confidence, k.frequency), reverse=True)
         return ranked
     
-    def _word_boundary_match(self, pattern: str, text: str) -> bool:
-        """Check if pattern matches with word boundaries (for short keywords)."""
-        if len(pattern) < 4:
-            # Use word boundary for short patterns to avoid false positives
-            return bool(re.search(r'\b' + re.escape(pattern) + r'\b', text))
-        return pattern in text
-    
     def _build_technical_patterns(self) -> Dict[str, str]:
         """Build technical keyword patterns (pattern -> display name)."""
         return {
@@ -0,0 +1,162 @@
+"""
+Keyword Matching Module
+
+Finds which configured keywords occur in a text in one pass over the text,
+instead of one `in` / `re.search` per keyword.
+
+Matching rules are the ones documented in config/keywords_config.py:
+- Short keywords (< 4 chars) must sit on word boundaries
+- Longer keywords match as substrings (unless `whole_words` is set)
+
+Uses a pyahocorasick automaton when the package is installed, otherwise a
+single regex shaped like a trie of the keywords (Python's `re` backtracks, so
+a flat "a|b|c" alternation would retry every keyword at every position).
+Small tables skip both and use str.find per keyword.
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Tables up to this size are scanned keyword by keyword with str.find, which
+# runs in C and beats a Python-level automaton or regex pass over long text
+SMALL_TABLE_SIZE = 64
+
+
+def _is_word_char(text: str, i: int) -> bool:
+    """Regex word-character test at text[i]; out of range counts as non-word."""
+    if 0 <= i < len(text):
+        ch = text[i]
+        return ch.isalnum() or ch == '_'
+    return False
+
+
+def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] has regex word boundaries on both sides."""
+    return (
+        _is_word_char(text, start - 1) != _is_word_char(text, start)
+        and _is_word_char(text, end - 1) != _is_word_char(text, end)
+    )
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex matching the longest keyword at a position, as a nested trie."""
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A keyword ends here: try to extend it first (greedy), else stop
+            return '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed keyword set against lowercase text.
+
+    Built once per keyword table. `find` returns the matched keywords in
+    table order, so callers that count or rank matches keep their existing
+    tie-breaking.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        """
+        Compile the matcher for the given (lowercase) keywords.
+
+        Args:
+            keywords: Keywords to match, in table order
+            whole_words: Require word boundaries for every keyword,
+                not only short ones
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        self._rank = {kw: i for i, kw in enumerate(self.keywords)}
+        self._needs_boundary = frozenset(
+            kw for kw in self.keywords if whole_words or len(kw) < 4
+        )
+
+        self._automaton = None
+        self._pattern = None
+        if len(self.keywords) <= SMALL_TABLE_SIZE:
+            self.backend = 'find'
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            self.backend = 'ahocorasick'
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+        else:
+            self.backend = 'regex'
+            self._pattern = re.compile('(?=(' + _trie_pattern(self.keywords) + '))')
+            # The regex reports only the longest keyword at each position;
+            # any keyword that is a prefix of it starts there too
+            keyword_set = set(self.keywords)
+            self._prefixes = {}
+            for kw in self.keywords:
+                prefixes = tuple(kw[:i] for i in range(1, len(kw)) if kw[:i] in keyword_set)
+                if prefixes:
+                    self._prefixes[kw] = prefixes
+
+    def find(self, text: str) -> List[str]:
+        """
+        Return every keyword that matches in the text.
+
+        Args:
+            text: Lowercase text to search
+
+        Returns:
+            Matched keywords, in keyword table order
+        """
+        if self._automaton is None and self._pattern is None:
+            return self._find_each(text)
+
+        found = set()
+        for start, keyword in self._occurrences(text):
+            if keyword in found:
+                continue
+            if (keyword not in self._needs_boundary
+                    or _on_word_boundaries(text, start, start + len(keyword))):
+                found.add(keyword)
+        return sorted(found, key=self._rank.__getitem__)
+
+    def _find_each(self, text: str) -> List[str]:
+        """Small-table scan: str.find per keyword, stopping at its first valid hit."""
+        found = []
+        for keyword in self.keywords:
+            needs_boundary = keyword in self._needs_boundary
+            start = text.find(keyword)
+            while start != -1:
+                if not needs_boundary or _on_word_boundaries(text, start, start + len(keyword)):
+                    found.append(keyword)
+                    break
+                start = text.find(keyword, start + 1)
+        return found
+
+    def _occurrences(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start, keyword) for every keyword occurrence, overlaps included."""
+        if AHOCORASICK_AVAILABLE:
+            for end, keyword in self._automaton.iter(text):
+                yield end - len(keyword) + 1, keyword
+        else:
+            for match in self._pattern.finditer(text):
+                start = match.start()
+                longest = match.group(1)
+                yield start, longest
+                for keyword in self._prefixes.get(longest, ()):
+                    yield start, keyword
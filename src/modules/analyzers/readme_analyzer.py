@@ -8,6 +8,7 @@ using pattern matching and keyword detection.
 import re
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass
+from modules.analyzers.keyword_matcher import KeywordMatcher
 
 
 @dataclass
@@ -55,6 +56,12 @@ class ReadmeAnalyzer:
         # Technology keyword patterns (case-insensitive)
         self.tech_keywords = self._build_tech_keywords()
         
+        # One whole-word matcher per category, compiled once and reused
+        self.keyword_matchers = {
+            category: KeywordMatcher((kw.lower() for kw in keywords), whole_words=True)
+            for category, keywords in self.tech_keywords.items()
+        }
+        
         # Stopwords to filter out false positives
         self.stopwords = self._build_stopwords()
         
@@ -145,11 +152,15 @@ class ReadmeAnalyzer:
         
         skills = []
         
+        # Lowercased once: the package/import/keyword passes match against it
+        # without re.IGNORECASE (names are re-cased for display anyway)
+        content_lower = readme_content.lower()
+        
         # Extract from package managers
-        skills.extend(self._extract_from_packages(readme_content))
+        skills.extend(self._extract_from_packages(content_lower))
         
         # Extract from import statements
-        skills.extend(self._extract_from_imports(readme_content))
+        skills.extend(self._extract_from_imports(content_lower))
         
         # Extract from badges
         skills.extend(self._extract_from_badges(readme_content))
@@ -158,17 +169,17 @@ class ReadmeAnalyzer:
         skills.extend(self._extract_from_code_blocks(readme_content))
         
         # Extract from technology keywords
-        skills.extend(self._extract_from_keywords(readme_content))
+        skills.extend(self._extract_from_keywords(content_lower))
         
         # Deduplicate and merge
         return self._deduplicate_skills(skills)
     
     def _extract_from_packages(self, content: str) -> List[ExtractedSkill]:
-        """Extract skills from package manager commands"""
+        """Extract skills from package manager commands (content must be lowercase)"""
         skills = []
         
         for pm, pattern in self.package_patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+            matches = re.finditer(pattern, content, re.MULTILINE)
             for match in matches:
                 packages = match.group(1).split()
                 for package in packages:
@@ -193,7 +204,7 @@ class ReadmeAnalyzer:
         return skills
     
     def _extract_from_imports(self, content: str) -> List[ExtractedSkill]:
-        """Extract skills from import statements in code blocks"""
+        """Extract skills from import statements in code blocks (content must be lowercase)"""
         skills = []
         
         # Python: import X, from X import Y
@@ -204,7 +215,7 @@ class ReadmeAnalyzer:
         }
         
         for lang, pattern in import_patterns.items():
-            matches = re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE)
+            matches = re.finditer(pattern, content, re.MULTILINE)
             for match in matches:
                 module = match.group(1) or match.group(2) if match.lastindex >= 2 else match.group(1)
                 if module:
@@ -293,23 +304,19 @@ class ReadmeAnalyzer:
         
         return skills
     
-    def _extract_from_keywords(self, content: str) -> List[ExtractedSkill]:
-        """Extract skills from technology keyword mentions"""
+    def _extract_from_keywords(self, content_lower: str) -> List[ExtractedSkill]:
+        """Extract skills from technology keyword mentions in lowercased content"""
         skills = []
-        content_lower = content.lower()
-        
-        # Search for each category
-        for category, keywords in self.tech_keywords.items():
-            for keyword in keywords:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                if re.search(pattern, content_lower):
-                    skills.append(ExtractedSkill(
-                        name=keyword.title(),
-                        category=category.rstrip('s'),  # 'frameworks' -> 'framework'
-                        source='keyword',
-                        confidence=0.7
-                    ))
+        
+        # Search for each category (word boundaries avoid partial matches)
+        for category, matcher in self.keyword_matchers.items():
+            for keyword in matcher.find(content_lower):
+                skills.append(ExtractedSkill(
+                    name=keyword.title(),
+                    category=category.rstrip('s'),  # 'frameworks' -> 'framework'
+                    source='keyword',
+                    confidence=0.7
+                ))
         
         return skills
     
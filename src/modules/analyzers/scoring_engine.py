@@ -69,12 +69,11 @@ class ScoringEngine:
         days_since = (now - last_commit).days
         active_repos = sum(1 for d in commits if (now - d).days < 90)
         
-        # Production signals
+        # Production signals (each description lowercased once)
+        production_terms = ("production", "deploy", "workflow")
         has_prod = any(
-            "production" in (r.get('description') or "").lower() or
-            "deploy" in (r.get('description') or "").lower() or
-            "workflow" in (r.get('description') or "").lower()
-            for r in repos
+            any(term in description for term in production_terms)
+            for description in ((r.get('description') or "").lower() for r in repos)
         )
         
         # Account age
@@ -3,12 +3,12 @@ Technology Stack Analyzer Module
 
 Analyzes programming languages, frameworks, and libraries used in repositories.
 """
-import re
-from typing import Dict, List
+from typing import Dict, List, Set
 from collections import Counter
 from datetime import datetime
 from utils.logger import logger
 from config.keywords_config import get_tech_categories, get_all_keywords_flat
+from modules.analyzers.keyword_matcher import KeywordMatcher
 from modules.analyzers.dependency_parser import dependency_parser
 
 
@@ -27,6 +27,7 @@ class TechAnalyzer:
         """Initialize analyzer with technology keywords."""
         self.tech_categories = get_tech_categories()
         self.all_tech_keywords = get_all_keywords_flat()
+        self.keyword_matcher = KeywordMatcher(self.all_tech_keywords)
         logger.info(f"[TOOL] Tech Analyzer initialized with {len(self.all_tech_keywords)} keywords")
     
     def analyze_technologies(self, repos: List[Dict], language_distribution: Dict[str, float]) -> Dict:
@@ -46,10 +47,13 @@ class TechAnalyzer:
         primary = []
         secondary = []
         
+        # pushed_at parsed once per repo, not once per (language, repo)
+        recent_repos = self._recently_pushed(repos)
+        
         for lang, pct in sorted_langs:
             relevant_repos = self._find_repos_with_language(repos, lang)
             count = len(relevant_repos)
-            recent = self._has_recent_usage(repos, relevant_repos)
+            recent = self._has_recent_usage(recent_repos, relevant_repos)
             
             technologies.append({
                 "name": lang,
@@ -89,11 +93,10 @@ class TechAnalyzer:
         for repo in repos:
             text = self._prepare_text(repo)
             
-            for keyword, category in self.all_tech_keywords.items():
-                if self._keyword_matches(keyword, text):
-                    fw_counts[keyword] += 1
-                    if keyword not in fw_evidence:
-                        fw_evidence[keyword] = {"repo": repo['name'], "cat": category}
+            for keyword in self.keyword_matcher.find(text):
+                fw_counts[keyword] += 1
+                if keyword not in fw_evidence:
+                    fw_evidence[keyword] = {"repo": repo['name'], "cat": self.all_tech_keywords[keyword]}
         
         frameworks = []
         for keyword, count in fw_counts.most_common(25):
@@ -177,16 +180,21 @@ class TechAnalyzer:
             if r.get('languages', {}).get('percentages', {}).get(language, 0) > 0
         ]
     
-    def _has_recent_usage(self, repos: List[Dict], repo_names: List[str]) -> bool:
-        """Check if any of the repos have been updated in last 180 days."""
+    def _recently_pushed(self, repos: List[Dict]) -> Set[str]:
+        """Names of repositories pushed to in the last 180 days."""
+        now = datetime.utcnow()
+        recent = set()
         for repo in repos:
-            if repo.get('name') in repo_names:
-                pushed = repo.get('pushed_at')
-                if pushed:
-                    dt = datetime.fromisoformat(pushed.replace("Z", "+00:00")).replace(tzinfo=None)
-                    if (datetime.utcnow() - dt).days < 180:
-                        return True
-        return False
+            pushed = repo.get('pushed_at')
+            if pushed:
+                dt = datetime.fromisoformat(pushed.replace("Z", "+00:00")).replace(tzinfo=None)
+                if (now - dt).days < 180:
+                    recent.add(repo.get('name'))
+        return recent
+    
+    def _has_recent_usage(self, recent_repos: Set[str], repo_names: List[str]) -> bool:
+        """Check if any of the repos have been updated in last 180 days."""
+        return any(name in recent_repos for name in repo_names)
     
     def _prepare_text(self, repo: Dict) -> str:
         """Prepare searchable text from repository data."""
@@ -194,15 +202,6 @@ class TechAnalyzer:
         topics = " ".join(repo.get('topics') or [])
         return (description + " " + topics).lower()
     
-    def _keyword_matches(self, keyword: str, text: str) -> bool:
-        """Check if keyword matches in text with appropriate matching strategy."""
-        if len(keyword) < 4:
-            # Short keywords need word boundary
-            return bool(re.search(r'\b' + re.escape(keyword) + r'\b', text))
-        else:
-            # Longer keywords use substring match
-            return keyword in text
-    
     def _generate_summary(self, primary_langs: List[str]) -> str:
         """Generate technology summary text."""
         if not primary_langs:
@@ -10,12 +10,7 @@ Services:
 - cache_service: Caching layer
 """
 
-from services.github_service import GitHubService
-from services.analysis_service import analysis_service
-from services.storage_service import storage_service
-
-__all__ = [
-    'GitHubService',
-    'analysis_service',
-    'storage_service'
-]
+# No re-exports: importing any service (github_service on startup) would
+# otherwise load analysis_service and every analyzer with it. Import from
+# the service's own module, e.g.
+#   from services.storage_service import storage_service
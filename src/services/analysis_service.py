@@ -197,10 +197,7 @@ class AnalysisService:
             keywords = pattern_keywords
             
             # Detect technologies used
-            detected_techs = set()
-            for kw, category in tech_analyzer.all_tech_keywords.items():
-                if tech_analyzer._keyword_matches(kw, text):
-                    detected_techs.add(kw)
+            detected_techs = set(tech_analyzer.keyword_matcher.find(text))
             
             # Infer project type
             p_type = self._infer_project_type(text)
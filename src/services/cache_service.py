@@ -1,87 +1,456 @@
-"""File-based caching service with TTL (Time To Live)"""
-import json
+"""
+Two-tier caching service with TTL (Time To Live)
+
+Tier 1: In-process LRU (short TTL) so hot usernames skip I/O entirely
+Tier 2: Redis when REDIS_URL is configured, file-based JSON otherwise
+
+Keys follow the `{domain}:{id}` scheme (e.g. "profile:torvalds").
+"""
+import asyncio
+import hashlib
+import shutil
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+
+import orjson
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    RedisError = OSError
+try:
+    import zstandard
+    from zstandard import ZstdError
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    ZstdError = ValueError
+from utils.logger import logger
+from utils.ttl_cache import LocalTTLCache
 
 # Import will be available after config is created
 try:
     from core.config import settings
     cache_ttl = settings.CACHE_TTL_SECONDS
+    min_ttl = settings.CACHE_MIN_TTL_SECONDS
+    max_ttl = settings.CACHE_MAX_TTL_SECONDS
+    redis_url = settings.REDIS_URL
+    local_cache_maxsize = settings.LOCAL_CACHE_MAXSIZE
+    local_cache_ttl = settings.LOCAL_CACHE_TTL_SECONDS
+    file_cache_max_entries = settings.FILE_CACHE_MAX_ENTRIES
 except ImportError:
     cache_ttl = 86400  # Default 24 hours
+    min_ttl = 3600
+    max_ttl = 604800
+    redis_url = None
+    local_cache_maxsize = 1024
+    local_cache_ttl = 30
+    file_cache_max_entries = 10000
+
+
+# Pattern matching every key this service writes (used by clear_all_cache)
+CACHE_KEY_PATTERN = "profile:*"
 
+# Accounts with this many followers change often - halve their adaptive TTL
+CELEBRITY_FOLLOWERS = 10000
 
-# Create cache directory
+# Activity-age buckets (upper bound in seconds, label) for hit-rate feedback
+TTL_BUCKETS = (
+    (86400, "<1d"),
+    (7 * 86400, "<7d"),
+    (30 * 86400, "<30d"),
+    (float("inf"), ">=30d"),
+)
+EWMA_ALPHA = 0.1
+_bucket_hit_rate: Dict[str, float] = {}
+
+# Create cache directory (file backend), sharded as cache/<2 hex>/<hash>.json
 cache_dir = Path("cache")
 cache_dir.mkdir(exist_ok=True)
 
+# File backend LRU (path -> None); oldest files are deleted past file_cache_max_entries
+_file_lru: "OrderedDict[Path, None]" = OrderedDict()
+
+# Redis client singleton - created in FastAPI lifespan via init_cache()
+_redis = None
+
+
+_local = LocalTTLCache(maxsize=local_cache_maxsize, ttl=local_cache_ttl)
+
+# Per-key locks so concurrent misses for one key hit the backend once
+_key_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _lock_for(key: str) -> asyncio.Lock:
+    lock = _key_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _key_locks[key] = lock
+    return lock
+
+
+async def init_cache():
+    """
+    Connect the Redis backend (called once from the FastAPI lifespan).
+
+    Falls back to the file backend when REDIS_URL is unset, the `redis`
+    package is missing, or the server is unreachable.
+    """
+    global _redis
+
+    if not redis_url:
+        logger.info(f"[CACHE] Using file cache: {cache_dir.absolute()}")
+        await _load_file_index()
+        return
+    if not REDIS_AVAILABLE:
+        logger.warning("[CACHE] redis package not available, using file cache")
+        await _load_file_index()
+        return
+
+    client = aioredis.Redis.from_url(redis_url, decode_responses=False)
+    try:
+        await client.ping()
+    except (RedisError, OSError) as e:
+        logger.warning(f"[CACHE] Redis unreachable ({e}), using file cache")
+        await client.aclose()
+        await _load_file_index()
+        return
+
+    _redis = client
+    logger.info("[CACHE] Using Redis cache")
+
+
+async def close_cache():
+    """Close the Redis connection pool (called on shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
 
 async def get_cache(key: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve cached data if it exists and hasn't expired
-    
+
     Args:
         key: Cache key (e.g., "profile:torvalds")
-    
+
     Returns:
         Cached data if valid, None if expired or not found
     """
-    cache_file = cache_dir / f"{key}.json"
-    
+    data = _local.get(key)
+    if data is not None:
+        return data
+
+    async with _lock_for(key):
+        # Another coroutine may have loaded it while we waited
+        data = _local.get(key)
+        if data is not None:
+            return data
+
+        if _redis is not None:
+            data = await _redis_get(key)
+        else:
+            data = await _file_get(key)
+
+        if data is not None:
+            _local.set(key, data)
+        return data
+
+
+async def set_cache(key: str, data: Dict[str, Any], ttl: Optional[int] = None):
+    """
+    Store data in cache with timestamp
+
+    Args:
+        key: Cache key
+        data: Data to cache
+        ttl: Per-entry TTL in seconds (defaults to CACHE_TTL_SECONDS)
+    """
+    ttl = ttl or cache_ttl
+    _local.set(key, data)
+
+    if _redis is not None:
+        await _redis_set(key, data, ttl)
+    else:
+        await _file_set(key, data, ttl)
+
+
+async def clear_cache_by_key(key: str):
+    """
+    Delete specific cache entry
+
+    Backend errors are logged, not raised: a failed invalidation must not
+    fail the request that triggered it.
+    """
+    _local.pop(key)
+
+    if _redis is not None:
+        try:
+            await _redis.unlink(key)
+        except (RedisError, OSError) as e:
+            logger.warning(f"[CACHE] Delete error for {key}: {e}")
+        return
+
+    cache_file = _cache_path(key)
+    _file_lru.pop(cache_file, None)
+    try:
+        await asyncio.to_thread(cache_file.unlink, missing_ok=True)
+    except OSError as e:
+        logger.warning(f"[CACHE] Delete error for {key}: {e}")
+
+
+async def clear_all_cache():
+    """Clear every cache entry (both tiers)"""
+    _local.clear()
+
+    if _redis is not None:
+        # SCAN + pipelined UNLINK instead of KEYS/DEL: never blocks the server
+        batch = []
+        async for key in _redis.scan_iter(match=CACHE_KEY_PATTERN, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await _redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            await _redis.unlink(*batch)
+        return
+
+    _file_lru.clear()
+    await asyncio.to_thread(_clear_files)
+
+
+# ============= ADAPTIVE TTL =============
+
+def activity_age_seconds(profile: Dict[str, Any], repositories: List[Dict[str, Any]]) -> Optional[float]:
+    """
+    Seconds since the most recent profile update or repository push.
+
+    Returns:
+        Age in seconds, or None when no timestamp can be parsed
+    """
+    latest = None
+    timestamps = [profile.get("updated_at")] + [r.get("pushed_at") for r in repositories]
+
+    for ts in timestamps:
+        if not ts:
+            continue
+        try:
+            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        if latest is None or dt > latest:
+            latest = dt
+
+    if latest is None:
+        return None
+    return max(0.0, (datetime.now(timezone.utc) - latest).total_seconds())
+
+
+def adaptive_ttl(profile: Dict[str, Any], age: Optional[float]) -> int:
+    """
+    Per-user TTL: dormant accounts are cached longer, active ones shorter.
+
+    TTL = clamp(age, CACHE_MIN_TTL_SECONDS, CACHE_MAX_TTL_SECONDS), halved
+    for accounts with CELEBRITY_FOLLOWERS or more followers.
+
+    Args:
+        profile: GitHub profile dict
+        age: activity_age_seconds() of the profile
+    """
+    if age is None:
+        return cache_ttl
+
+    ttl = min(max(age, min_ttl), max_ttl)
+    if (profile.get("followers") or 0) >= CELEBRITY_FOLLOWERS:
+        ttl = max(min_ttl, ttl / 2)
+    return int(ttl)
+
+
+def activity_bucket(age: Optional[float]) -> Optional[str]:
+    """TTL_BUCKETS label for an activity age (None when the age is unknown)."""
+    if age is None:
+        return None
+    return next(label for bound, label in TTL_BUCKETS if age < bound)
+
+
+def record_cache_outcome(label: Optional[str], hit: bool):
+    """
+    Update the rolling hit-rate (EWMA) of an activity-age bucket.
+
+    Logged so CACHE_MIN/MAX_TTL_SECONDS can be tuned from real traffic.
+    Takes the activity_bucket() label, which cache entries store, so hits
+    don't re-parse the profile's timestamps.
+    """
+    if label is None:
+        return
+
+    previous = _bucket_hit_rate.get(label, 1.0 if hit else 0.0)
+    rate = (1 - EWMA_ALPHA) * previous + EWMA_ALPHA * (1.0 if hit else 0.0)
+    _bucket_hit_rate[label] = rate
+    logger.debug(f"[CACHE] Bucket {label} hit-rate EWMA: {rate:.2f}")
+
+
+def get_cache_stats() -> Dict[str, float]:
+    """Rolling hit-rate per activity-age bucket."""
+    return {label: round(rate, 3) for label, rate in _bucket_hit_rate.items()}
+
+
+# ============= REDIS BACKEND =============
+# Values are orjson bytes, zstd-compressed when zstandard is installed
+# (~3.5x smaller for profile entries). Uncompressed values written before
+# compression (or by a worker without zstandard) still load.
+
+ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+if ZSTD_AVAILABLE:
+    # Only used from the event loop thread, so sharing one of each is safe
+    _zstd_compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    value = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return _zstd_compressor.compress(value) if ZSTD_AVAILABLE else value
+
+
+def _decode(raw: bytes) -> Dict[str, Any]:
+    if ZSTD_AVAILABLE and raw[:4] == _ZSTD_MAGIC:
+        raw = _zstd_decompressor.decompress(raw)
+    return orjson.loads(raw)
+
+
+async def _redis_get(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        raw = await _redis.get(key)
+        return _decode(raw) if raw is not None else None
+    except (RedisError, OSError, orjson.JSONDecodeError, ZstdError) as e:
+        logger.warning(f"[CACHE] Read error for {key}: {e}")
+        return None
+
+
+async def _redis_set(key: str, data: Dict[str, Any], ttl: int):
+    try:
+        await _redis.set(key, _encode(data), ex=ttl)
+    except (RedisError, OSError, TypeError) as e:  # orjson.JSONEncodeError is a TypeError
+        logger.warning(f"[CACHE] Write error for {key}: {e}")
+
+
+# ============= FILE BACKEND =============
+# Disk reads/writes run in a worker thread so a slow disk never stalls the
+# event loop; entries are compact orjson bytes (machine-only, no indent).
+# Files are sharded by key hash so no directory grows past a few thousand
+# entries, and the LRU index (maintained on the event loop) caps the total.
+
+def _cache_path(key: str) -> Path:
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return cache_dir / digest[:2] / f"{digest}.json"
+
+
+def _track_file(path: Path) -> List[Path]:
+    """Mark `path` most recently used; returns files evicted past the cap."""
+    _file_lru[path] = None
+    _file_lru.move_to_end(path)
+    evicted = []
+    while len(_file_lru) > file_cache_max_entries:
+        evicted.append(_file_lru.popitem(last=False)[0])
+    return evicted
+
+
+def _scan_files() -> List[Path]:
+    entries = []
+    for path in cache_dir.glob("*/*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    return [path for _, path in sorted(entries)]
+
+
+async def _load_file_index():
+    """Rebuild the LRU index from files left by a previous run (oldest first)."""
+    evicted = []
+    for path in await asyncio.to_thread(_scan_files):
+        evicted.extend(_track_file(path))
+    if evicted:
+        await asyncio.to_thread(_unlink_files, evicted)
+    logger.info(f"[CACHE] Indexed {len(_file_lru)} cached files")
+
+
+def _unlink_files(paths: List[Path]):
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _read_file(cache_file: Path, key: str) -> Optional[Dict[str, Any]]:
     if not cache_file.exists():
         return None
-    
+
     try:
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Check TTL
+        data = orjson.loads(cache_file.read_bytes())
+
+        # Check TTL (per-entry TTL, global default for older entries)
         cached_at = data.get("_cached_at", 0)
         now = datetime.now().timestamp()
         age = now - cached_at
-        
-        if age < cache_ttl:
+
+        if age < data.get("_ttl", cache_ttl):
             return data["data"]
         else:
             # Cache expired, delete file
-            cache_file.unlink()
+            cache_file.unlink(missing_ok=True)
             return None
-    except Exception as e:
-        print(f"[WARN] Cache read error for {key}: {e}")
+    except (OSError, orjson.JSONDecodeError, KeyError) as e:
+        logger.warning(f"[CACHE] Read error for {key}: {e}")
         return None
 
 
-async def set_cache(key: str, data: Dict[str, Any]):
-    """
-    Store data in cache with timestamp
-    
-    Args:
-        key: Cache key
-        data: Data to cache
-    """
-    cache_file = cache_dir / f"{key}.json"
-    
+def _write_file(cache_file: Path, key: str, data: Dict[str, Any], ttl: int, evicted: List[Path]):
     try:
         cache_data = {
             "_cached_at": datetime.now().timestamp(),
+            "_ttl": ttl,
             "data": data
         }
-        
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, default=str)
-    except Exception as e:
-        print(f"[WARN] Cache write error for {key}: {e}")
 
+        cache_file.parent.mkdir(exist_ok=True)
+        cache_file.write_bytes(
+            orjson.dumps(cache_data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        )
+    except (OSError, TypeError) as e:  # orjson.JSONEncodeError is a TypeError
+        logger.warning(f"[CACHE] Write error for {key}: {e}")
 
-async def clear_cache_by_key(key: str):
-    """Delete specific cache entry"""
-    cache_file = cache_dir / f"{key}.json"
-    if cache_file.exists():
-        cache_file.unlink()
+    _unlink_files(evicted)
 
 
-async def clear_all_cache():
-    """Clear entire cache directory"""
-    for cache_file in cache_dir.glob("*.json"):
-        cache_file.unlink()
+def _clear_files():
+    # One tree removal instead of an unlink per entry
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    cache_dir.mkdir(exist_ok=True)
+
+
+async def _file_get(key: str) -> Optional[Dict[str, Any]]:
+    cache_file = _cache_path(key)
+    data = await asyncio.to_thread(_read_file, cache_file, key)
+    if data is None:
+        _file_lru.pop(cache_file, None)
+    else:
+        # A file another worker wrote can push this index past the cap
+        evicted = _track_file(cache_file)
+        if evicted:
+            await asyncio.to_thread(_unlink_files, evicted)
+    return data
+
+
+async def _file_set(key: str, data: Dict[str, Any], ttl: int):
+    cache_file = _cache_path(key)
+    evicted = _track_file(cache_file)
+    await asyncio.to_thread(_write_file, cache_file, key, data, ttl, evicted)
@@ -3,10 +3,135 @@ import aiohttp
 import jwt
 import time
 import asyncio
-from typing import Dict, List, Optional, Any
-from core.config import settings
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+import orjson
+
+from core.config import (
+    settings, MAX_REPOS_PER_USER, MAX_README_BYTES, CACHE_TTL_SECONDS, GITHUB_INSTALLATION_IDS
+)
+from core.exceptions import RateLimitError
+from utils.ttl_cache import LocalTTLCache
 from utils.logger import logger
-from datetime import datetime
+from utils.singleflight import SingleFlight
+from datetime import datetime, timezone
+
+
+# Connection pool sizing for the long-lived shared session
+POOL_MAX_CONNECTIONS = 200
+POOL_MAX_PER_HOST = 100
+POOL_KEEPALIVE_SECONDS = 60
+POOL_DNS_TTL_SECONDS = 300  # aiohttp's default (10s) re-resolves api.github.com constantly
+
+# Repositories analyzed concurrently per profile
+REPO_FANOUT_LIMIT = 10
+
+# Repository listing pages (100 repos each) read per user on the REST path
+REPO_PAGE_SIZE = 100
+REPO_PAGES_MAX = 10
+
+# Wait before retrying a failed token refresh while other installations work
+TOKEN_RETRY_SECONDS = 60
+
+# Back-off used when GitHub signals a rate limit without saying for how long
+RATE_LIMIT_DEFAULT_RETRY_SECONDS = 60
+
+# A REST call rate limited for at most this long is retried once in place;
+# longer waits surface as RateLimitError (HTTP 429 to our client)
+RATE_LIMIT_RETRY_MAX_SECONDS = 5
+
+# Below this many REST calls left in the hourly window, at most
+# RATE_LIMIT_LOW_CONCURRENCY REST calls are in flight at once
+RATE_LIMIT_LOW_REMAINING = 500
+RATE_LIMIT_LOW_CONCURRENCY = 4
+
+# REST responses kept with their ETag for conditional re-fetches (a 304
+# doesn't count against the rate limit and carries no body). Capped by
+# total body size per worker too; bigger bodies (huge recursive trees) are
+# never kept.
+ETAG_CACHE_MAXSIZE = 4096
+ETAG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+ETAG_CACHE_MAX_BODY_BYTES = 1024 * 1024
+ETAG_CACHE_TTL_SECONDS = CACHE_TTL_SECONDS
+
+RAW_CONTENT = "application/vnd.github.v3.raw"
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Profile + top repositories + languages + README in one round trip.
+# Field names are mapped back to the REST shapes in _graphql_* helpers.
+PROFILE_QUERY = """
+query($login: String!, $repoCount: Int!) {
+  rateLimit { remaining resetAt cost }
+  user(login: $login) {
+    login databaseId avatarUrl url name company websiteUrl location email
+    bio twitterUsername isHireable createdAt updatedAt
+    followers { totalCount }
+    following { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    repositories(
+      first: $repoCount, privacy: PUBLIC, ownerAffiliations: OWNER, isFork: false, isArchived: false,
+      orderBy: {field: STARGAZERS, direction: DESC}
+    ) {
+      nodes {
+        name nameWithOwner description url owner { login }
+        stargazerCount forkCount diskUsage isArchived isFork
+        hasWikiEnabled hasProjectsEnabled createdAt updatedAt pushedAt
+        primaryLanguage { name }
+        defaultBranchRef { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        openIssues: issues(states: OPEN) { totalCount }
+        openPullRequests: pullRequests(states: OPEN) { totalCount }
+        languages(first: 100, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+        readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+        readmeLower: object(expression: "HEAD:readme.md") { ... on Blob { text } }
+      }
+    }
+  }
+}
+"""
+
+
+@dataclass
+class InstallationToken:
+    """Access token and last known REST quota of one App installation"""
+    installation_id: int
+    token: Optional[str] = None
+    expires_at: float = 0
+    remaining: Optional[int] = None  # Last X-RateLimit-Remaining seen
+    reset_at: int = 0  # ...and its X-RateLimit-Reset (epoch seconds)
+    retry_at: float = 0  # After a failed refresh, not retried before this while others work
+    headers: Dict[Optional[str], Dict[str, str]] = field(default_factory=dict)  # Per Accept value, built once per token
+    
+    def set_token(self, token: str, expires_at: float):
+        """Store a fresh token and rebuild the request headers that carry it"""
+        self.token = token
+        self.expires_at = expires_at
+        auth = f"token {token}"
+        self.headers = {
+            None: {"Authorization": auth},
+            RAW_CONTENT: {"Authorization": auth, "Accept": RAW_CONTENT},
+        }
+    
+    def valid(self) -> bool:
+        """Token present and not within 5 minutes of expiring"""
+        return bool(self.token) and time.time() <= self.expires_at - 300
+    
+    def quota(self, now: float) -> float:
+        """Calls left in the current window (unknown, or window already reset: unlimited)"""
+        if self.remaining is None or now >= self.reset_at:
+            return float("inf")
+        return self.remaining
 
 
 class GitHubService:
@@ -15,8 +140,11 @@ class GitHubService:
     
     Features:
     - JWT token generation and auto-refresh
-    - Installation token exchange (1 hour validity)
-    - Parallel API calls (up to 32 concurrent)
+    - Installation token exchange (1 hour validity), for one or more
+      installations; each call uses the one with the most quota left
+    - Conditional REST requests (ETag / If-None-Match)
+    - Parallel API calls (REPO_FANOUT_LIMIT repos per profile, at most
+      POOL_MAX_PER_HOST requests in flight to api.github.com)
     - Complete error handling and timeouts
     
     Authentication Flow:
@@ -30,29 +158,80 @@ class GitHubService:
         self.app_id = settings.GITHUB_APP_ID
         self.private_key = settings.GITHUB_PRIVATE_KEY
         self.installation_id = settings.GITHUB_INSTALLATION_ID
-        self.token = None
-        self.expires_at = 0
+        self.installations = [InstallationToken(i) for i in GITHUB_INSTALLATION_IDS]
+        self._signing_key = None  # Parsed private key, loaded on first JWT
+        self._jwt = None  # App JWT, reused until shortly before it expires
+        self._jwt_expires_at = 0
         self.session = None
+        self._owns_session = False
+        self._token_lock = asyncio.Lock()
+        self.rate_limit: Dict[str, Any] = {}  # Last GraphQL rateLimit block
+        self.rate_limited_until = 0.0  # Profile fetches fail fast until this time
+        self._low_quota_gate = asyncio.Semaphore(RATE_LIMIT_LOW_CONCURRENCY)
+        self._etag_cache = LocalTTLCache(
+            maxsize=ETAG_CACHE_MAXSIZE,
+            ttl=ETAG_CACHE_TTL_SECONDS,
+            max_bytes=ETAG_CACHE_MAX_BYTES,
+            sizeof=lambda entry: len(entry[1])  # (etag, raw body)
+        )
+        self._profile_flight = SingleFlight()  # In-flight analyze_profile calls per username
     
     async def __aenter__(self):
-        """Async context manager entry - create HTTP session"""
-        timeout = aiohttp.ClientTimeout(total=settings.API_TIMEOUT_SECONDS)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        """Async context manager entry - create HTTP session (if not already started)"""
+        if self.session is None:
+            await self.start()
+            self._owns_session = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - close HTTP session"""
-        if self.session:
+        """Async context manager exit - close HTTP session this block opened"""
+        if self._owns_session:
+            await self.close()
+            self._owns_session = False
+    
+    async def start(self):
+        """Open the pooled HTTP session (keep-alive connections are reused across requests)"""
+        if self.session is None or self.session.closed:
+            timeout = aiohttp.ClientTimeout(total=settings.API_TIMEOUT_SECONDS)
+            connector = aiohttp.TCPConnector(
+                limit=POOL_MAX_CONNECTIONS,
+                limit_per_host=POOL_MAX_PER_HOST,
+                keepalive_timeout=POOL_KEEPALIVE_SECONDS,
+                ttl_dns_cache=POOL_DNS_TTL_SECONDS
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=timeout, connector=connector, json_serialize=_json_dumps
+            )
+    
+    async def close(self):
+        """Close the HTTP session and its connection pool"""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
+    
+    async def warm_up(self):
+        """
+        Mint the installation tokens and open a pooled TLS connection up front,
+        so the first cache miss doesn't pay for JWT signing and handshakes.
+        """
+        await self.ensure_token()
+        url = "https://api.github.com/rate_limit"
+        installation = self._pick_installation()
+        async with self.session.get(url, headers=self._authed_headers(installation)) as resp:
+            self._track_quota(resp, installation)
+            await resp.read()
     
-    async def _get_installation_token(self) -> str:
+    async def _get_installation_token(self, installation: InstallationToken) -> str:
         """
         Generate JWT and exchange for installation access token
         
         Flow:
         1. Create JWT with App ID (10 min validity)
         2. POST to GitHub API to exchange JWT for installation token
-        3. Store token and expiration time
+        3. Store token and expiration time on the installation
+        
+        Args:
+            installation: Installation to mint the token for
         
         Returns:
             Installation access token
@@ -61,19 +240,10 @@ class GitHubService:
             Exception: If token exchange fails
         """
         now = int(time.time())
-        
-        # Create JWT payload
-        payload = {
-            "iat": now,  # Issued at
-            "exp": now + 600,  # Expires in 10 minutes
-            "iss": str(self.app_id)  # Issuer (App ID)
-        }
-        
-        # Encode JWT using RS256 algorithm with private key
-        jwt_token = jwt.encode(payload, self.private_key, algorithm="RS256")
+        jwt_token = await self._app_jwt(now)
         
         # Exchange JWT for installation token
-        url = f"https://api.github.com/app/installations/{self.installation_id}/access_tokens"
+        url = f"https://api.github.com/app/installations/{installation.installation_id}/access_tokens"
         headers = {
             "Authorization": f"Bearer {jwt_token}",
             "Accept": "application/vnd.github.v3+json"
@@ -81,20 +251,198 @@ class GitHubService:
         
         async with self.session.post(url, headers=headers, json={}) as resp:
             if resp.status == 201:
-                data = await resp.json()
-                self.token = data["token"]
-                self.expires_at = now + 3600  # Token valid for 1 hour
-                logger.info(f"[SUCCESS] Generated new GitHub token for installation {self.installation_id}")
-                return self.token
+                data = orjson.loads(await resp.read())
+                installation.set_token(data["token"], now + 3600)  # Token valid for 1 hour
+                logger.info(f"[SUCCESS] Generated new GitHub token for installation {installation.installation_id}")
+                return installation.token
             
             error_msg = await resp.text()
             raise Exception(f"Token exchange failed ({resp.status}): {error_msg}")
     
+    async def _app_jwt(self, now: int) -> str:
+        """
+        App JWT for the token exchange (10 min validity)
+        
+        Reused while it has more than a minute left, so retries after a
+        failed exchange don't each pay for an RSA signature. Signing runs
+        in a worker thread to keep the event loop free.
+        """
+        if self._jwt and now < self._jwt_expires_at - 60:
+            return self._jwt
+        
+        # Create JWT payload
+        payload = {
+            "iat": now,  # Issued at
+            "exp": now + 600,  # Expires in 10 minutes
+            "iss": str(self.app_id)  # Issuer (App ID)
+        }
+        
+        # Encode JWT using RS256 algorithm with private key
+        self._jwt = await asyncio.to_thread(self._sign_jwt, payload)
+        self._jwt_expires_at = now + 600
+        return self._jwt
+    
+    def _sign_jwt(self, payload: Dict[str, Any]) -> str:
+        """
+        RS256-sign the payload with the App private key
+        
+        The PEM is parsed once and the key object kept: jwt.encode would
+        otherwise re-parse (and re-validate) it on every call, which costs
+        far more than the signature itself.
+        """
+        if self._signing_key is None:
+            if CRYPTOGRAPHY_AVAILABLE:
+                self._signing_key = load_pem_private_key(self.private_key.encode(), password=None)
+            else:
+                self._signing_key = self.private_key
+        return jwt.encode(payload, self._signing_key, algorithm="RS256")
+    
     async def ensure_token(self):
-        """Auto-refresh token if expired or about to expire (5 min buffer)"""
+        """
+        Auto-refresh tokens that are expired or about to expire (5 min buffer)
+        
+        Installations are refreshed concurrently. One failing is logged and
+        left alone for TOKEN_RETRY_SECONDS while another has a valid token.
+        """
+        if not self._stale_installations():
+            return
+        async with self._token_lock:
+            # Concurrent requests share the session - only one refreshes
+            stale = self._stale_installations()
+            if not stale:
+                return
+            results = await asyncio.gather(
+                *(self._get_installation_token(i) for i in stale), return_exceptions=True
+            )
+            errors = []
+            for installation, result in zip(stale, results):
+                if isinstance(result, Exception):
+                    installation.retry_at = time.time() + TOKEN_RETRY_SECONDS
+                    errors.append(result)
+            if errors and not any(i.valid() for i in self.installations):
+                raise errors[0]
+            for error in errors:
+                logger.warning(f"[GITHUB] Token refresh failed for an installation: {error}")
+    
+    def _stale_installations(self) -> List[InstallationToken]:
+        """Installations needing a refresh (all invalid ones when none is valid)"""
+        invalid = [i for i in self.installations if not i.valid()]
+        if len(invalid) == len(self.installations):
+            return invalid
+        now = time.time()
+        return [i for i in invalid if now >= i.retry_at]
+    
+    def _pick_installation(self) -> InstallationToken:
+        """Installation with a valid token and the most REST quota left"""
         now = time.time()
-        if not self.token or now > self.expires_at - 300:
-            await self._get_installation_token()
+        return max(self.installations, key=lambda i: (i.valid(), i.quota(now)))
+    
+    @staticmethod
+    def _authed_headers(
+        installation: InstallationToken,
+        accept: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Request headers with the installation's token (plus Accept / If-None-Match when given)
+        
+        Without an ETag this is the installation's prebuilt dict, shared
+        between requests - don't modify it.
+        """
+        headers = installation.headers.get(accept)
+        if headers is None:
+            headers = {"Authorization": f"token {installation.token}"}
+            if accept:
+                headers["Accept"] = accept
+        if etag:
+            headers = {**headers, "If-None-Match": etag}
+        return headers
+    
+    async def _get(
+        self,
+        url: str,
+        accept: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        truncate: bool = True
+    ) -> Tuple[int, Any]:
+        """
+        Conditional GET against the REST API
+        
+        Responses that carry an ETag are kept (raw) per URL and re-requested
+        with If-None-Match; a 304 is answered from the kept copy.
+        
+        Args:
+            url: API URL
+            accept: Accept header; RAW_CONTENT returns text, anything else parsed JSON
+            max_bytes: Read at most this much of the body (RAW_CONTENT only)
+            truncate: Return a body over max_bytes cut at max_bytes; when
+                False it is rejected (413) and never kept
+        
+        Returns:
+            (status, body) - body is the error text for non-200 statuses
+        
+        Raises:
+            RateLimitError: GitHub is rate limiting us
+        
+        Runs at most RATE_LIMIT_LOW_CONCURRENCY at a time while the REST
+        quota is nearly spent. A rate-limited call moves on to another
+        installation with quota left, or else retries once after a short
+        Retry-After.
+        """
+        if self._quota_low():
+            async with self._low_quota_gate:
+                return await self._send_get(url, accept, max_bytes, truncate)
+        return await self._send_get(url, accept, max_bytes, truncate)
+    
+    async def _send_get(
+        self,
+        url: str,
+        accept: Optional[str],
+        max_bytes: Optional[int],
+        truncate: bool
+    ) -> Tuple[int, Any]:
+        """One conditional GET for _get, retried on other installations / after short rate limits"""
+        slept = False
+        while True:
+            installation = self._pick_installation()
+            cached = self._etag_cache.get(url)
+            headers = self._authed_headers(installation, accept, etag=cached[0] if cached else None)
+            
+            async with self.session.get(url, headers=headers) as resp:
+                self._track_quota(resp, installation)
+                if resp.status == 304 and cached:
+                    raw = cached[1]
+                    break
+                wait = self._retry_after(resp)
+                if wait is None:
+                    if resp.status != 200:
+                        return resp.status, await resp.text()
+                    if max_bytes is None:
+                        raw = await resp.read()
+                    elif truncate:
+                        raw = await _read_bounded(resp, max_bytes)
+                    else:
+                        raw = await _read_bounded(resp, max_bytes + 1)
+                        if len(raw) > max_bytes:
+                            return 413, f"Body larger than {max_bytes} bytes"
+                    etag = resp.headers.get("ETag")
+                    if etag and len(raw) <= ETAG_CACHE_MAX_BODY_BYTES:
+                        self._etag_cache.set(url, (etag, raw))
+                    break
+            
+            self._exhausted(installation, wait)
+            if self._pick_installation().quota(time.time()) > 0:
+                continue  # Another installation still has calls left
+            if slept or wait > RATE_LIMIT_RETRY_MAX_SECONDS:
+                self._rate_limited(wait)
+            logger.info(f"[GITHUB] Rate limited for {wait}s, retrying {url}")
+            await asyncio.sleep(wait)
+            slept = True
+        
+        # Parsed per call: callers get their own objects to modify
+        if accept == RAW_CONTENT:
+            return 200, raw.decode("utf-8", errors="replace")
+        return 200, orjson.loads(raw)
     
     async def get_user_profile(self, username: str) -> Dict[str, Any]:
         """
@@ -115,54 +463,61 @@ class GitHubService:
         await self.ensure_token()
         
         url = f"https://api.github.com/users/{username}"
-        headers = {"Authorization": f"token {self.token}"}
+        status, body = await self._get(url)
+        if status == 404:
+            raise ValueError(f"User '{username}' not found on GitHub")
+        if status != 200:
+            raise Exception(f"GitHub API error ({status}): {body}")
         
-        async with self.session.get(url, headers=headers) as resp:
-            if resp.status == 404:
-                raise ValueError(f"User '{username}' not found on GitHub")
-            if resp.status != 200:
-                raise Exception(f"GitHub API error ({resp.status}): {await resp.text()}")
-            
-            return await resp.json()
+        return body
     
-    async def get_user_repos(self, username: str) -> List[Dict[str, Any]]:
+    async def get_user_repos(self, username: str, public_repos: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get user repositories, sorted by stars, filtered (no forks/archived)
         
-        GET /users/{username}/repos?sort=stars&per_page=100&direction=desc
+        GET /users/{username}/repos?type=owner&per_page=100&page={n}
         
         Args:
             username: GitHub username
+            public_repos: The profile's public_repos count; when given, every
+                page (up to REPO_PAGES_MAX) is fetched concurrently, otherwise
+                only the first
         
         Returns:
             List of repository objects (top MAX_REPOS_PER_USER by stars)
         """
         await self.ensure_token()
         
-        url = f"https://api.github.com/users/{username}/repos?sort=stars&per_page=100&direction=desc"
-        headers = {"Authorization": f"token {self.token}"}
+        pages = min(REPO_PAGES_MAX, -(-public_repos // REPO_PAGE_SIZE)) if public_repos else 1
+        results = await asyncio.gather(*(
+            self._get(
+                f"https://api.github.com/users/{username}/repos"
+                f"?type=owner&per_page={REPO_PAGE_SIZE}&page={page}"
+            )
+            for page in range(1, pages + 1)
+        ))
+        
+        repos = []
+        for status, body in results:
+            if status != 200:
+                raise Exception(f"GitHub API error ({status}): {body}")
+            repos.extend(body)
+        
+        # Filter: no forks, no archived repos
+        filtered = (
+            r for r in repos
+            if not r.get('fork', False) and not r.get('archived', False)
+        )
         
-        async with self.session.get(url, headers=headers) as resp:
-            if resp.status != 200:
-                raise Exception(f"GitHub API error ({resp.status}): {await resp.text()}")
-            
-            repos = await resp.json()
-            
-            # Filter: no forks, no archived repos
-            filtered = [
-                r for r in repos
-                if not r.get('fork', False) and not r.get('archived', False)
-            ]
-            
-            # Sort by stars and limit to max repos
-            sorted_repos = sorted(
-                filtered,
-                key=lambda x: x.get('stargazers_count', 0),
-                reverse=True
-            )[:settings.MAX_REPOS_PER_USER]
-            
-            logger.info(f"[DATA] Found {len(sorted_repos)} repos for {username}")
-            return sorted_repos
+        # Top max repos by stars (same order and ties as a full stable sort)
+        sorted_repos = heapq.nlargest(
+            MAX_REPOS_PER_USER,
+            filtered,
+            key=lambda x: x.get('stargazers_count', 0)
+        )
+        
+        logger.info(f"[DATA] Found {len(sorted_repos)} repos for {username}")
+        return sorted_repos
     
     async def _get_repo_languages(self, owner: str, repo: str) -> Dict[str, int]:
         """
@@ -176,13 +531,10 @@ class GitHubService:
         await self.ensure_token()
         
         url = f"https://api.github.com/repos/{owner}/{repo}/languages"
-        headers = {"Authorization": f"token {self.token}"}
         
         try:
-            async with self.session.get(url, headers=headers) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                return {}
+            status, body = await self._get(url)
+            return body if status == 200 else {}
         except asyncio.TimeoutError:
             logger.warning(f"[PERF] Timeout getting languages for {owner}/{repo}")
             return {}
@@ -197,21 +549,16 @@ class GitHubService:
         GET /repos/{owner}/{repo}/readme (with raw content type)
         
         Returns:
-            README content as plain text, or None if not found
+            README content as plain text (truncated to MAX_README_BYTES), or None if not found
         """
         await self.ensure_token()
         
         url = f"https://api.github.com/repos/{owner}/{repo}/readme"
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3.raw"  # Request raw content
-        }
         
         try:
-            async with self.session.get(url, headers=headers) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-                return None
+            # Request raw content, at most MAX_README_BYTES of it
+            status, body = await self._get(url, accept=RAW_CONTENT, max_bytes=MAX_README_BYTES)
+            return body if status == 200 else None
         except asyncio.TimeoutError:
             logger.warning(f"[PERF] Timeout getting README for {owner}/{repo}")
             return None
@@ -238,13 +585,11 @@ class GitHubService:
         # Try main branch first, fallback to master if not found
         for branch in [default_branch, 'master' if default_branch == 'main' else 'main']:
             url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
-            headers = {"Authorization": f"token {self.token}"}
             
             try:
-                async with self.session.get(url, headers=headers) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get('tree', [])
+                status, data = await self._get(url)
+                if status == 200:
+                    return data.get('tree', [])
             except Exception as e:
                 logger.warning(f"[WARN] Error getting tree for {owner}/{repo} on {branch}: {e}")
                 continue
@@ -261,7 +606,8 @@ class GitHubService:
             owner: Repository owner
             repo: Repository name
             file_path: Path to markdown file
-            max_size_kb: Maximum file size to fetch (default 100KB)
+            max_size_kb: Maximum file size to fetch (default 100KB); larger
+                files are neither downloaded in full nor cached
         
         Returns:
             Dict with filename, path, content, length_chars or None if error/too large
@@ -269,28 +615,23 @@ class GitHubService:
         await self.ensure_token()
         
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3.raw"  # Get raw content
-        }
         
         try:
-            async with self.session.get(url, headers=headers) as resp:
-                if resp.status == 200:
-                    content = await resp.text()
-                    
-                    # Check size limit (100KB default)
-                    if len(content) > max_size_kb * 1024:
-                        logger.warning(f"[WARN] Skipping large markdown file {file_path} ({len(content)} bytes)")
-                        return None
-                    
-                    return {
-                        "filename": file_path.split('/')[-1],
-                        "path": file_path,
-                        "content": content,  # COMPLETE content, no truncation
-                        "length_chars": len(content)
-                    }
+            # Get raw content, refused past the size limit (100KB default)
+            status, content = await self._get(
+                url, accept=RAW_CONTENT, max_bytes=max_size_kb * 1024, truncate=False
+            )
+            if status == 413:
+                logger.warning(f"[WARN] Skipping large markdown file {file_path} (over {max_size_kb}KB)")
                 return None
+            if status == 200:
+                return {
+                    "filename": file_path.split('/')[-1],
+                    "path": file_path,
+                    "content": content,  # COMPLETE content, no truncation
+                    "length_chars": len(content)
+                }
+            return None
         except Exception as e:
             logger.warning(f"[ERROR] Error fetching {file_path}: {e}")
             return None
@@ -419,12 +760,21 @@ class GitHubService:
         return valid_files
 
     
-    async def _analyze_single_repo(self, repo_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_single_repo(
+        self,
+        repo_data: Dict[str, Any],
+        languages: Optional[Dict[str, int]] = None,
+        readme: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Analyze single repository: get languages + README + markdown files + dependency files in parallel
         
         Args:
             repo_data: Repository object from GitHub API
+            languages: Language bytes already fetched (GraphQL); fetched via REST when None
+            readme: README text already fetched (GraphQL); fetched via REST when None
+            now: Reference time for days_since_last_commit (current UTC time when None)
         
         Returns:
             Enriched repository data with languages, README, markdown files, dependency files, and commit activity
@@ -437,8 +787,8 @@ class GitHubService:
         tree = await self._get_repo_tree(owner, repo, default_branch)
         
         # Fetch languages, README, markdown files, and dependency files in parallel
-        lang_task = self._get_repo_languages(owner, repo)
-        readme_task = self._get_repo_readme(owner, repo)
+        lang_task = self._get_repo_languages(owner, repo) if languages is None else _resolved(languages)
+        readme_task = self._get_repo_readme(owner, repo) if readme is None else _resolved(readme)
         markdown_task = self._get_all_markdown_files(owner, repo, default_branch)
         dependency_task = self._get_dependency_files(owner, repo, tree)
         
@@ -461,11 +811,9 @@ class GitHubService:
         days_since_commit = None
         if pushed_at:
             try:
-                from datetime import datetime, timezone
                 commit_dt = datetime.fromisoformat(pushed_at.replace('Z', '+00:00'))
-                now = datetime.now(timezone.utc)
-                days_since_commit = max(0, (now - commit_dt).days)
-            except:
+                days_since_commit = max(0, ((now or datetime.now(timezone.utc)) - commit_dt).days)
+            except (TypeError, ValueError):
                 pass
         
         # Build enriched repo data with ALL metrics
@@ -519,13 +867,205 @@ class GitHubService:
             "dependency_files": dependency_files  # Dict of filename -> content
         }
     
+    def _check_rate_limit(self, resp: aiohttp.ClientResponse, installation: InstallationToken):
+        """Raise RateLimitError if GitHub refused the request for rate limiting."""
+        seconds = self._retry_after(resp)
+        if seconds is not None:
+            self._exhausted(installation, seconds)
+            self._rate_limited(seconds)
+    
+    @staticmethod
+    def _retry_after(resp: aiohttp.ClientResponse) -> Optional[int]:
+        """
+        Seconds to wait if GitHub refused the request for rate limiting
+        (429, or 403 with Retry-After or an exhausted X-RateLimit-Remaining),
+        None otherwise.
+        """
+        if resp.status not in (403, 429):
+            return None
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after is None and resp.headers.get("X-RateLimit-Remaining") == "0":
+            reset = resp.headers.get("X-RateLimit-Reset")
+            if reset and reset.isdigit():
+                retry_after = str(max(1, int(reset) - int(time.time())))
+        if retry_after is None and resp.status == 403:
+            return None
+        return int(retry_after) if retry_after and retry_after.isdigit() else RATE_LIMIT_DEFAULT_RETRY_SECONDS
+    
+    @staticmethod
+    def _track_quota(resp: aiohttp.ClientResponse, installation: InstallationToken):
+        """Remember the REST quota GitHub reports on each response."""
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if remaining and remaining.isdigit() and reset and reset.isdigit():
+            installation.remaining = int(remaining)
+            installation.reset_at = int(reset)
+    
+    @staticmethod
+    def _exhausted(installation: InstallationToken, seconds: int):
+        """Mark an installation as out of quota for `seconds`."""
+        installation.remaining = 0
+        installation.reset_at = int(time.time()) + seconds
+    
+    def _quota_low(self) -> bool:
+        """True while even the best installation has fewer than RATE_LIMIT_LOW_REMAINING calls left."""
+        return self._pick_installation().quota(time.time()) < RATE_LIMIT_LOW_REMAINING
+    
+    def _rate_limited(self, seconds: int):
+        """
+        Raise RateLimitError; once no installation has quota left, profile
+        fetches also fail fast for `seconds`.
+        """
+        now = time.time()
+        if self._pick_installation().quota(now) <= 0:
+            self.rate_limited_until = max(self.rate_limited_until, now + seconds)
+            logger.warning(f"[GITHUB] Rate limited, pausing profile fetches for {seconds}s")
+        raise RateLimitError(seconds)
+    
+    async def _analyze_repos(
+        self,
+        repos: List[Tuple[Dict[str, Any], Optional[Dict[str, int]], Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze repositories concurrently, at most REPO_FANOUT_LIMIT at a time
+        
+        Each repo fans out into several calls of its own (tree, markdown,
+        manifests), so the cap keeps one profile from opening hundreds of
+        requests at once and tripping GitHub's secondary rate limits.
+        
+        Args:
+            repos: (repo_data, prefetched languages, prefetched readme) per repo
+        
+        Returns:
+            Enriched repos in input order; failed repos are dropped
+        """
+        semaphore = asyncio.Semaphore(REPO_FANOUT_LIMIT)
+        now = datetime.now(timezone.utc)  # One reference time for the whole profile
+        
+        async def one(repo_data, languages, readme):
+            async with semaphore:
+                return await self._analyze_single_repo(repo_data, languages, readme, now)
+        
+        results = await asyncio.gather(*(one(*repo) for repo in repos), return_exceptions=True)
+        
+        # Drop failed repos (one bad repo shouldn't fail the profile), but say which
+        valid = []
+        for (repo_data, _, _), result in zip(repos, results):
+            if isinstance(result, Exception):
+                logger.warning(f"[ERROR] Skipping repo {repo_data.get('full_name') or repo_data.get('name')}: {result!r}")
+            else:
+                valid.append(result)
+        return valid
+    
     async def analyze_profile(self, username: str) -> Dict[str, Any]:
         """
         MAIN METHOD: Complete GitHub profile analysis
         
+        Uses the single GraphQL query when possible and falls back to the
+        REST flow on any GraphQL failure (errors, organizations, outages),
+        except a rate limit: REST would only spend more of the same quota.
+        
+        Concurrent calls for the same username share one fetch, whichever
+        endpoint they come from (/analyze and /report coalesce separately
+        above this); the shared result is read-only.
+        
+        Args:
+            username: GitHub username
+        
+        Returns:
+            Complete analysis with profile, repos, languages, READMEs, commit activity
+        
+        Raises:
+            RateLimitError: GitHub is rate limiting us (retry_after in seconds)
+        """
+        remaining = self.rate_limited_until - time.time()
+        if remaining > 0:
+            raise RateLimitError(int(remaining) + 1)
+        
+        return await self._profile_flight.do(username.lower(), lambda: self._fetch_profile(username))
+    
+    async def _fetch_profile(self, username: str) -> Dict[str, Any]:
+        """GraphQL analysis with REST fallback (one run per username, see analyze_profile)"""
+        try:
+            return await self.graphql_analyze_profile(username)
+        except RateLimitError:
+            raise
+        except Exception as e:
+            logger.warning(f"[GRAPHQL] Falling back to REST for {username}: {e}")
+            return await self.rest_analyze_profile(username)
+    
+    async def graphql_analyze_profile(self, username: str) -> Dict[str, Any]:
+        """
+        Profile analysis with one GraphQL query for profile + repos + languages + READMEs
+        
+        Trees, extra markdown files and dependency manifests are still REST
+        calls per repo; READMEs not named README.md/readme.md fall back to REST.
+        
+        Args:
+            username: GitHub username
+        
+        Returns:
+            Same shape as rest_analyze_profile
+        
+        Raises:
+            Exception: If the query fails or returns errors
+        """
+        start_time = time.time()
+        await self.ensure_token()
+        
+        installation = self._pick_installation()
+        headers = {"Authorization": f"bearer {installation.token}"}
+        body = {
+            "query": PROFILE_QUERY,
+            "variables": {"login": username, "repoCount": MAX_REPOS_PER_USER}
+        }
+        
+        async with self.session.post(GRAPHQL_URL, headers=headers, json=body) as resp:
+            self._check_rate_limit(resp, installation)
+            if resp.status != 200:
+                raise Exception(f"GitHub GraphQL error ({resp.status}): {await resp.text()}")
+            result = orjson.loads(await resp.read())
+        
+        if any(error.get("type") == "RATE_LIMITED" for error in result.get("errors") or ()):
+            self._exhausted(installation, RATE_LIMIT_DEFAULT_RETRY_SECONDS)
+            self._rate_limited(RATE_LIMIT_DEFAULT_RETRY_SECONDS)
+        if result.get("errors"):
+            raise Exception(f"GitHub GraphQL errors: {result['errors']}")
+        
+        data = result["data"]
+        self.rate_limit = data.get("rateLimit") or {}
+        user = data.get("user")
+        if user is None:
+            raise Exception(f"GraphQL returned no user for '{username}'")
+        
+        profile = _graphql_profile(user)
+        nodes = user["repositories"]["nodes"]
+        repos = [_graphql_repo(node) for node in nodes]
+        logger.info(f"[DATA] Found {len(repos)} repos for {username} (GraphQL, {self.rate_limit.get('remaining')} points left)")
+        
+        valid_repos = await self._analyze_repos([
+            (
+                repo,
+                {e["node"]["name"]: e["size"] for e in node["languages"]["edges"]},
+                _graphql_readme(node)
+            )
+            for repo, node in zip(repos, nodes)
+        ])
+        
+        return {
+            "profile": profile,
+            "repositories": valid_repos,
+            "api_calls": 1,
+            "latency_ms": int((time.time() - start_time) * 1000)
+        }
+    
+    async def rest_analyze_profile(self, username: str) -> Dict[str, Any]:
+        """
+        Complete GitHub profile analysis over the REST API
+        
         Flow:
         1. Get user profile (1 API call)
-        2. Get user repositories (1 API call)  
+        2. Get user repositories (1 API call per 100 repos, pages in parallel)
         3. For each repo, get languages + README (2N API calls in parallel)
         4. Use pushed_at from repo data for commit activity (no extra calls!)
         
@@ -546,19 +1086,13 @@ class GitHubService:
         
         profile, repos = await asyncio.gather(profile_task, repos_task)
         
+        # More than one page: list them all (page 1 again is a free 304)
+        if (profile.get('public_repos') or 0) > REPO_PAGE_SIZE:
+            repos = await self.get_user_repos(username, profile['public_repos'])
+        
         # Step 3: Analyze all repos in parallel (languages + READMEs)
         # Note: pushed_at for commit activity already in repo data - no extra calls needed!
-        repo_tasks = [
-            self._analyze_single_repo(repo)
-            for repo in repos
-        ]
-        repo_results = await asyncio.gather(*repo_tasks, return_exceptions=True)
-        
-        # Filter out any errors
-        valid_repos = [
-            r for r in repo_results
-            if not isinstance(r, Exception)
-        ]
+        valid_repos = await self._analyze_repos([(repo, None, None) for repo in repos])
         
         end_time = time.time()
         api_calls = 2 + (len(repos) * 2)  # profile + repos + (languages + readme) per repo
@@ -569,3 +1103,135 @@ class GitHubService:
             "api_calls": api_calls,
             "latency_ms": int((end_time - start_time) * 1000)
         }
+
+
+async def _read_bounded(resp: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """Read at most max_bytes of a response body; the rest is never downloaded into memory."""
+    chunks = []
+    remaining = max_bytes
+    while remaining > 0:
+        chunk = await resp.content.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Request body serializer for the session (aiohttp expects str)."""
+    return orjson.dumps(obj).decode()
+
+
+# ============= GRAPHQL → REST SHAPE MAPPING =============
+
+async def _resolved(value: Any) -> Any:
+    """Awaitable for data that is already available (keeps asyncio.gather uniform)."""
+    return value
+
+
+def _graphql_profile(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL User to the REST /users/{username} fields we use."""
+    return {
+        "login": user["login"],
+        "id": user.get("databaseId"),
+        "avatar_url": user.get("avatarUrl", ""),
+        "html_url": user.get("url"),
+        "type": "User",
+        "name": user.get("name"),
+        "company": user.get("company"),
+        "blog": user.get("websiteUrl") or "",
+        "location": user.get("location"),
+        "email": user.get("email") or None,
+        "hireable": user.get("isHireable") or None,
+        "bio": user.get("bio"),
+        "twitter_username": user.get("twitterUsername"),
+        "public_repos": user["publicRepos"]["totalCount"],
+        "followers": user["followers"]["totalCount"],
+        "following": user["following"]["totalCount"],
+        "created_at": user.get("createdAt", ""),
+        "updated_at": user.get("updatedAt", ""),
+    }
+
+
+def _graphql_repo(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL Repository to the REST /users/{username}/repos item fields we use."""
+    return {
+        "name": node["name"],
+        "full_name": node["nameWithOwner"],
+        "owner": {"login": node["owner"]["login"]},
+        "description": node.get("description"),
+        "html_url": node["url"],
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "watchers_count": node.get("stargazerCount", 0),  # REST reports stars here too
+        "open_issues_count": node["openIssues"]["totalCount"] + node["openPullRequests"]["totalCount"],
+        "size": node.get("diskUsage") or 0,
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+        "archived": node.get("isArchived", False),
+        "fork": node.get("isFork", False),
+        "has_wiki": node.get("hasWikiEnabled", False),
+        "has_projects": node.get("hasProjectsEnabled", False),
+        "created_at": node.get("createdAt", ""),
+        "updated_at": node.get("updatedAt", ""),
+        "pushed_at": node.get("pushedAt"),
+        "default_branch": (node.get("defaultBranchRef") or {}).get("name", "main"),
+    }
+
+
+def _graphql_readme(node: Dict[str, Any]) -> Optional[str]:
+    """README text from the query, or None so the REST endpoint resolves other names/formats."""
+    for alias in ("readme", "readmeLower"):
+        blob = node.get(alias) or {}
+        text = blob.get("text")
+        if text:
+            # Same cap as the REST fetch (at most 4 UTF-8 bytes per character,
+            # so shorter texts can't exceed it and skip the encode)
+            if len(text) > MAX_README_BYTES // 4:
+                encoded = text.encode("utf-8")
+                if len(encoded) > MAX_README_BYTES:
+                    text = encoded[:MAX_README_BYTES].decode("utf-8", errors="replace")
+            return text
+    return None
+
+
+# Shared client singleton - created in FastAPI lifespan via init_github_service()
+_shared_service: Optional[GitHubService] = None
+
+
+async def init_github_service() -> GitHubService:
+    """
+    Create and warm the shared GitHubService (called once from the FastAPI lifespan).
+
+    A failed warm-up is logged, not fatal - the token is minted lazily instead.
+    """
+    global _shared_service
+
+    service = GitHubService()
+    await service.start()
+    try:
+        await service.warm_up()
+        logger.info("[GITHUB] Session warmed up (token + pooled connection)")
+    except Exception as e:
+        logger.warning(f"[GITHUB] Warm-up failed ({e}), token will be fetched on first request")
+
+    _shared_service = service
+    return service
+
+
+async def get_github_service() -> GitHubService:
+    """Shared GitHubService, started lazily when the lifespan hasn't run (scripts, tests)."""
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = GitHubService()
+    await _shared_service.start()
+    return _shared_service
+
+
+async def close_github_service():
+    """Close the shared session (called on shutdown)."""
+    global _shared_service
+    if _shared_service is not None:
+        await _shared_service.close()
+        _shared_service = None
@@ -4,12 +4,23 @@ JSON Storage Service for GitHub Analysis Data
 Stores all analyzed GitHub profiles as JSON files in the db/ directory.
 Each user gets their own JSON file with complete analysis data.
 """
-import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+
+import orjson
+
 from utils.logger import logger
+from utils.ttl_cache import LocalTTLCache
+
+
+# Recently saved/loaded documents kept parsed in memory, so a report right
+# after /analyze (or a repeated report) skips the disk read and JSON parse.
+# Documents are several hundred KB each, hence the small cap.
+RECENT_DOCUMENTS_MAXSIZE = 32
+RECENT_DOCUMENTS_TTL_SECONDS = 300
 
 
 class StorageService:
@@ -20,6 +31,9 @@ class StorageService:
         db/
         ├── {username}.json  # Full analysis data
         └── ...
+    
+    Loaded documents are shared with the in-memory layer: treat them as
+    read-only.
     """
     
     def __init__(self, storage_dir: str = "db"):
@@ -33,6 +47,9 @@ class StorageService:
         current_dir = Path(__file__).parent.parent  # Go up to src/
         self.storage_dir = current_dir / storage_dir
         self.storage_dir.mkdir(exist_ok=True)
+        # Save/load run in worker threads; LocalTTLCache itself isn't thread-safe
+        self._recent = LocalTTLCache(maxsize=RECENT_DOCUMENTS_MAXSIZE, ttl=RECENT_DOCUMENTS_TTL_SECONDS)
+        self._recent_lock = threading.Lock()
         logger.info(f"[STORAGE] Storage directory: {self.storage_dir.absolute()}")
     
     def save_analysis(self, username: str, data: Dict[str, Any]) -> str:
@@ -57,9 +74,9 @@ class StorageService:
                 "data": data
             }
             
-            # Save to JSON file with pretty formatting
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(document, f, indent=2, ensure_ascii=False)
+            self._write_document(filepath, document)
+            with self._recent_lock:
+                self._recent.set(username, document)
             
             logger.info(f"[SAVE] Saved analysis for '{username}' to {filepath}")
             return str(filepath)
@@ -77,7 +94,16 @@ class StorageService:
         
         Returns:
             Analysis data if found, None otherwise
+        
+        Files in the legacy layout ({data: {user, repositories}}) are
+        rewritten once to the current one ({data: {data: {user, repositories}}}),
+        so readers only handle a single shape.
         """
+        with self._recent_lock:
+            document = self._recent.get(username)
+        if document is not None:
+            return document
+        
         try:
             filename = f"{username}.json"
             filepath = self.storage_dir / filename
@@ -86,8 +112,19 @@ class StorageService:
                 logger.warning(f"[WARN] No stored data found for '{username}'")
                 return None
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                document = json.load(f)
+            document = orjson.loads(filepath.read_bytes())
+            
+            payload = document.get("data") or {}
+            if "data" not in payload and "user" in payload:
+                document["data"] = {"data": payload}
+                try:
+                    self._write_document(filepath, document)
+                    logger.info(f"[MIGRATE] Rewrote '{username}' to the current storage layout")
+                except OSError as e:
+                    logger.warning(f"[MIGRATE] Could not rewrite '{username}' ({e}), migrating in memory only")
+            
+            with self._recent_lock:
+                self._recent.set(username, document)
             
             logger.info(f"[LOAD] Loaded analysis for '{username}' from {filepath}")
             return document
@@ -96,6 +133,13 @@ class StorageService:
             logger.error(f"[ERROR] Failed to load analysis for '{username}': {e}")
             return None
     
+    @staticmethod
+    def _write_document(filepath: Path, document: Dict[str, Any]):
+        """Write a storage document as pretty-printed JSON (UTF-8, not ASCII-escaped)."""
+        filepath.write_bytes(
+            orjson.dumps(document, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    
     def get_all_stored_users(self) -> List[str]:
         """
         Get list of all usernames with stored data.
@@ -122,6 +166,9 @@ class StorageService:
         Returns:
             True if deleted, False otherwise
         """
+        with self._recent_lock:
+            self._recent.pop(username)
+        
         try:
             filename = f"{username}.json"
             filepath = self.storage_dir / filename
@@ -0,0 +1,21 @@
+"""Wall-clock helpers for per-request timestamps"""
+import time
+from datetime import datetime, timezone
+
+
+# (epoch second, ISO string) of the last formatted timestamp
+_last_iso = (0, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as a naive ISO 8601 string, at second granularity.
+    
+    Formatted at most once per second; calls within the same second
+    return the cached string.
+    """
+    global _last_iso
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso = (now, datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat())
+    return _last_iso[1]
@@ -0,0 +1,76 @@
+"""
+Per-Client Rate Limiting
+
+Fixed-window request counter keyed by client IP, used as a FastAPI
+dependency so one noisy client can't monopolize GitHub quota or keep
+evicting everyone else's cache entries.
+"""
+
+import time
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Request
+
+
+class RateLimiter:
+    """
+    Allows `limit` requests per client per `window_seconds` window.
+
+    State is in-process (per worker) and reset wholesale when the window
+    rolls over, so memory stays bounded by the clients seen in one window.
+    A `limit` of 0 disables limiting. Every request counts, including ones
+    answered from cache.
+
+    Clients are keyed by the peer address, or, behind a reverse proxy, by
+    `client_header`: a header that proxy sets to the client IP. Only the
+    last entry of a comma-separated value (X-Forwarded-For) is used, as
+    that is the one the proxy in front of us appended; earlier entries
+    come from the client and can be forged. Leave `client_header` unset
+    when not behind a proxy, or any client could pick its own bucket.
+    """
+
+    def __init__(self, limit: int, window_seconds: int = 60, client_header: Optional[str] = None):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.client_header = client_header
+        self._window = 0
+        self._counts: Dict[str, int] = {}
+
+    def hit(self, client: str) -> Optional[int]:
+        """
+        Count one request for `client`.
+
+        Returns:
+            None if allowed, otherwise seconds until the window resets
+        """
+        if self.limit <= 0:
+            return None
+
+        now = time.time()
+        window = int(now // self.window_seconds)
+        if window != self._window:
+            self._window = window
+            self._counts.clear()
+
+        count = self._counts.get(client, 0) + 1
+        self._counts[client] = count
+        if count > self.limit:
+            return int((window + 1) * self.window_seconds - now) + 1
+        return None
+
+    def client_id(self, request: Request) -> str:
+        """Key the request is counted under (see class docstring)."""
+        if self.client_header:
+            forwarded = request.headers.get(self.client_header)
+            if forwarded:
+                return forwarded.rsplit(",", 1)[-1].strip()
+        return request.client.host if request.client else "unknown"
+
+    async def __call__(self, request: Request):
+        retry_after = self.hit(self.client_id(request))
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded, please retry later",
+                headers={"Retry-After": str(retry_after)}
+            )
@@ -0,0 +1,17 @@
+"""orjson-rendered JSON responses"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSONResponse serialized with orjson.
+    
+    Same output as FastAPI's ORJSONResponse, which is deprecated (and
+    warns on every response) in current FastAPI releases.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
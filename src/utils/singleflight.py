@@ -0,0 +1,48 @@
+"""
+Request Coalescing (Single-Flight)
+
+Collapses concurrent calls for the same key into one execution.
+Used to stop N simultaneous cache misses for one username from
+triggering N identical GitHub fetches.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Runs at most one `fn()` per key at a time; concurrent callers share its result.
+
+    The work runs as its own task and callers await it through
+    `asyncio.shield`, so a disconnecting caller never cancels the fetch
+    other callers are waiting on. Exceptions propagate to every caller.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Execute `fn` for `key`, or join the execution already in flight.
+
+        Lookup and insert happen without an intervening await, so no
+        lock is needed on the single-threaded event loop.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether work for `key` is currently running."""
+        return key in self._inflight
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,72 @@
+"""
+In-Process TTL Cache
+
+Bounded LRU with per-entry expiry, shared by the services that keep hot
+data in memory (cache tier 1, GitHub ETag bodies, recent stored documents).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+class LocalTTLCache:
+    """
+    Bounded in-process LRU with a per-entry expiry.
+
+    Sits in front of slower lookups (Redis/file cache, storage, GitHub
+    ETag revalidation) so repeated reads of the same key within `ttl`
+    seconds are a dict lookup instead of network/disk I/O.
+
+    With `max_bytes` (and `sizeof` to measure a value) the total size is
+    capped too: least recently used entries are evicted until it fits.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: int,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof if max_bytes is not None else None
+        self._bytes = 0
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self.pop(key)
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any):
+        if self._sizeof is not None:
+            self.pop(key)
+            self._bytes += self._sizeof(value)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize or (
+            self._sizeof is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, evicted) = self._data.popitem(last=False)
+            if self._sizeof is not None:
+                self._bytes -= self._sizeof(evicted)
+
+    def pop(self, key: str):
+        entry = self._data.pop(key, None)
+        if entry is not None and self._sizeof is not None:
+            self._bytes -= self._sizeof(entry[1])
+
+    def clear(self):
+        self._data.clear()
+        self._bytes = 0
@@ -3,6 +3,13 @@ import re
 from typing import Tuple
 
 
+# Compiled once at import - normalization runs on every request
+# Profile URL -> first path segment (query string and deeper paths dropped)
+_PROFILE_URL_RE = re.compile(r'https?://(?:github\.com/)?([^/?]*)')
+# Alphanumeric + hyphens, cannot start/end with hyphen
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$')
+
+
 def normalize_github_input(github_input: str) -> Tuple[str, bool]:
     """
     Normalize GitHub input (username or URL) to username
@@ -29,25 +36,17 @@ def normalize_github_input(github_input: str) -> Tuple[str, bool]:
     # Step 1: Clean input
     username = github_input.strip()
     
-    # Step 2: Extract from URL if present
-    if username.startswith('https://') or username.startswith('http://'):
-        # Remove protocol
-        username = re.sub(r'https?://', '', username)
-        # Remove github.com/
-        username = re.sub(r'github\.com/', '', username)
-        # Remove trailing slash
-        username = username.rstrip('/')
-        # Remove query params and path segments
-        username = username.split('?')[0]
-        username = username.split('/')[0]
+    # Step 2: Extract from URL if present (one anchored match)
+    url_match = _PROFILE_URL_RE.match(username)
+    if url_match:
+        username = url_match.group(1)
     
     # Step 3: Validate length (GitHub username requirements)
     if not (1 <= len(username) <= 39):
         raise ValueError(f'Username must be 1-39 characters, got {len(username)}')
     
     # Step 4: Validate format (GitHub username rules)
-    # Alphanumeric + hyphens, cannot start/end with hyphen
-    if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$', username):
+    if not _USERNAME_RE.match(username):
         raise ValueError(f'Invalid GitHub username format: {username}')
     
     # Step 5: Normalize to lowercase (GitHub is case-insensitive)
@@ -0,0 +1,13 @@
+"""Shared pytest setup: make the application packages under src/ importable."""
+import os
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+# core.config requires GitHub App credentials at import; unit tests never call GitHub
+os.environ.setdefault("GITHUB_APP_ID", "1")
+os.environ.setdefault("GITHUB_PRIVATE_KEY", "test-key")
+os.environ.setdefault("GITHUB_INSTALLATION_ID", "1")
@@ -0,0 +1,72 @@
+"""Unit tests for controllers.analysis_controller helpers (no GitHub calls)"""
+import asyncio
+
+import pytest
+
+from controllers import analysis_controller
+
+
+class SlowGitHubService:
+    """analyze_profile stand-in that finishes only when released."""
+
+    def __init__(self, error=None):
+        self.release = asyncio.Event()
+        self.finished = False
+        self.error = error
+
+    async def analyze_profile(self, username):
+        await self.release.wait()
+        self.finished = True
+        if self.error is not None:
+            raise self.error
+        return {"profile": {"login": username}}
+
+
+def test_timed_out_fetch_keeps_its_slot_until_it_finishes(monkeypatch):
+    async def scenario():
+        monkeypatch.setattr(analysis_controller, "_gh_semaphore", asyncio.Semaphore(1))
+        monkeypatch.setattr(analysis_controller, "ANALYZE_TIMEOUT_SECONDS", 0.01)
+        service = SlowGitHubService()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await analysis_controller._fetch_bounded(service, "octocat")
+        held_after_timeout = analysis_controller._gh_semaphore.locked()
+
+        service.release.set()
+        await asyncio.sleep(0.01)
+        return held_after_timeout, service.finished, analysis_controller._gh_semaphore.locked()
+
+    held_after_timeout, finished, held_after_finish = asyncio.run(scenario())
+    assert held_after_timeout
+    assert finished
+    assert not held_after_finish
+
+
+def test_failed_fetch_releases_its_slot(monkeypatch):
+    async def scenario():
+        monkeypatch.setattr(analysis_controller, "_gh_semaphore", asyncio.Semaphore(1))
+        service = SlowGitHubService(error=ValueError("User 'ghost' not found on GitHub"))
+        service.release.set()
+
+        with pytest.raises(ValueError):
+            await analysis_controller._fetch_bounded(service, "ghost")
+        await asyncio.sleep(0)
+        return analysis_controller._gh_semaphore.locked(), analysis_controller._gh_fetches
+
+    locked, in_flight = asyncio.run(scenario())
+    assert not locked
+    assert not in_flight
+
+
+def test_completed_fetch_returns_result_and_releases_slot(monkeypatch):
+    async def scenario():
+        monkeypatch.setattr(analysis_controller, "_gh_semaphore", asyncio.Semaphore(1))
+        service = SlowGitHubService()
+        service.release.set()
+        result = await analysis_controller._fetch_bounded(service, "octocat")
+        await asyncio.sleep(0)
+        return result, analysis_controller._gh_semaphore.locked()
+
+    result, locked = asyncio.run(scenario())
+    assert result == {"profile": {"login": "octocat"}}
+    assert not locked
@@ -0,0 +1,22 @@
+"""Unit tests for services.github_service (no GitHub calls)"""
+import re
+
+from services.github_service import PROFILE_QUERY
+
+
+def _selection_args(query: str, field: str) -> str:
+    """Argument list of the un-aliased `field(...)` selection that starts a line."""
+    match = re.search(rf"^\s*{field}\(([^)]*)\)", query, re.MULTILINE)
+    assert match, f"{field}(...) not found in query"
+    return match.group(1)
+
+
+def test_profile_query_only_selects_public_repositories():
+    # An installation token can see private repos; analysis responses are public
+    args = _selection_args(PROFILE_QUERY, "repositories")
+    assert "first: $repoCount" in args
+    assert "privacy: PUBLIC" in args
+
+
+def test_profile_query_public_repo_count_is_public_only():
+    assert re.search(r"publicRepos:\s*repositories\([^)]*privacy: PUBLIC", PROFILE_QUERY)
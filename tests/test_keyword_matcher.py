@@ -0,0 +1,75 @@
+"""Unit tests for modules.analyzers.keyword_matcher.KeywordMatcher backends"""
+import pytest
+
+from config.keywords_config import get_all_keywords_flat
+from modules.analyzers import keyword_matcher
+from modules.analyzers.keyword_matcher import KeywordMatcher
+
+
+# Short keywords (word-boundary rule), keywords that are prefixes or
+# substrings of others, and multi-word keywords, padded past SMALL_TABLE_SIZE
+SYNTHETIC_KEYWORDS = [
+    "go", "r", "c", "c++", "c#", "js", "ts", "ai", "ml", "api",
+    "react", "react native", "reactor", "redux", "node", "node.js", "nodejs",
+    "java", "javascript", "type", "typescript", "script",
+    "py", "python", "pytorch", "torch", "tensor", "tensorflow", "flow",
+    "machine learning", "learning", "deep learning",
+    "docker", "docker compose", "kubernetes", "k8s",
+    "postgres", "postgresql", "sql", "mysql", "nosql", "mongo", "mongodb",
+] + [f"lib{i:02d}" for i in range(40)]
+
+SAMPLE_TEXTS = [
+    "",
+    "a react native app written in typescript with redux and node.js",
+    "deep learning with pytorch and tensorflow; machine learning pipelines",
+    "go microservices on kubernetes (k8s) behind docker compose",
+    "golang, django and mongodb; postgresql over sql alchemy",
+    "c++ and c# engines, plus a bit of r for stats. ai/ml api.",
+    "javascriptjavascript typescripttype scripted reactors",
+    "lib00 lib07lib08 xlib39 lib39x lib1 lib399",
+    "ts-node, js_utils, py3, node_modules, c-extension",
+]
+
+
+def _matcher(monkeypatch, backend, keywords, whole_words):
+    """Build a matcher forced onto one backend (the module flags are read at find time too)."""
+    if backend == "find":
+        monkeypatch.setattr(keyword_matcher, "SMALL_TABLE_SIZE", len(keywords))
+    elif backend == "regex":
+        monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", False)
+    elif not keyword_matcher.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+
+    matcher = KeywordMatcher(keywords, whole_words=whole_words)
+    assert matcher.backend == backend
+    return matcher
+
+
+@pytest.mark.parametrize("backend", ["regex", "ahocorasick"])
+@pytest.mark.parametrize("whole_words", [False, True])
+@pytest.mark.parametrize("table", ["synthetic", "tech"])
+def test_backends_return_identical_results(monkeypatch, backend, whole_words, table):
+    keywords = SYNTHETIC_KEYWORDS if table == "synthetic" else list(get_all_keywords_flat())
+    texts = SAMPLE_TEXTS + [" ".join(keywords), "".join(keywords)]
+
+    with monkeypatch.context() as m:
+        reference = _matcher(m, "find", keywords, whole_words)
+        expected = [reference.find(text) for text in texts]
+
+    with monkeypatch.context() as m:
+        matcher = _matcher(m, backend, keywords, whole_words)
+        assert [matcher.find(text) for text in texts] == expected
+
+
+def test_short_keywords_need_word_boundaries():
+    matcher = KeywordMatcher(SYNTHETIC_KEYWORDS)
+    found = matcher.find("golang and django, pythonic")
+    assert "go" not in found
+    assert "py" not in found
+    assert "python" in found
+
+
+def test_results_follow_table_order():
+    matcher = KeywordMatcher(SYNTHETIC_KEYWORDS)
+    found = matcher.find("tensorflow beats react, says python")
+    assert found == sorted(found, key=SYNTHETIC_KEYWORDS.index)
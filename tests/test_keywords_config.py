@@ -0,0 +1,24 @@
+"""Unit tests for config.keywords_config lazy tables"""
+from config import keywords_config
+
+
+def test_lazy_table_is_built_once_even_when_empty(monkeypatch):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return frozenset()
+
+    monkeypatch.setitem(keywords_config._LAZY_TABLES, "EMPTY_TABLE", build)
+    try:
+        assert keywords_config._table("EMPTY_TABLE") == frozenset()
+        assert keywords_config._table("EMPTY_TABLE") == frozenset()
+    finally:
+        vars(keywords_config).pop("EMPTY_TABLE", None)
+    assert len(calls) == 1
+
+
+def test_lazy_tables_are_cached_as_module_globals():
+    first = keywords_config.get_all_keywords_flat()
+    assert keywords_config.get_all_keywords_flat() is first
+    assert vars(keywords_config)["FLAT_KEYWORDS"] is first
@@ -0,0 +1,96 @@
+"""Unit tests for utils.rate_limiter.RateLimiter"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time() inside the rate limiter."""
+    now = SimpleNamespace(value=6000.0)
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: now.value)
+    return now
+
+
+def test_allows_up_to_limit_then_rejects(clock):
+    limiter = RateLimiter(limit=3, window_seconds=60)
+    assert [limiter.hit("1.2.3.4") for _ in range(3)] == [None, None, None]
+    assert limiter.hit("1.2.3.4") is not None
+
+
+def test_clients_are_counted_separately(clock):
+    limiter = RateLimiter(limit=1, window_seconds=60)
+    assert limiter.hit("1.2.3.4") is None
+    assert limiter.hit("5.6.7.8") is None
+    assert limiter.hit("1.2.3.4") is not None
+
+
+def test_retry_after_counts_down_to_window_end(clock):
+    limiter = RateLimiter(limit=1, window_seconds=60)
+    clock.value = 6000.0 + 15.5  # Window [6000, 6060)
+    limiter.hit("1.2.3.4")
+    assert limiter.hit("1.2.3.4") == 45  # int(44.5) + 1
+
+    clock.value = 6000.0 + 59.9
+    assert limiter.hit("1.2.3.4") == 1
+
+
+def test_window_rollover_resets_counts(clock):
+    limiter = RateLimiter(limit=2, window_seconds=60)
+    clock.value = 6059.0
+    limiter.hit("1.2.3.4")
+    limiter.hit("1.2.3.4")
+    assert limiter.hit("1.2.3.4") is not None
+
+    clock.value = 6060.0
+    assert limiter.hit("1.2.3.4") is None
+    assert limiter.hit("1.2.3.4") is None
+    assert limiter.hit("1.2.3.4") == 61
+
+
+def test_zero_limit_disables_limiting(clock):
+    limiter = RateLimiter(limit=0)
+    assert all(limiter.hit("1.2.3.4") is None for _ in range(100))
+
+
+def test_dependency_raises_429_with_retry_after(clock):
+    limiter = RateLimiter(limit=1, window_seconds=60)
+    clock.value = 6030.0
+    request = SimpleNamespace(client=SimpleNamespace(host="1.2.3.4"), headers={})
+
+    asyncio.run(limiter(request))
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(limiter(request))
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "31"}
+
+
+def _request(host, headers=None):
+    return SimpleNamespace(client=SimpleNamespace(host=host), headers=headers or {})
+
+
+def test_client_is_peer_address_without_client_header():
+    limiter = RateLimiter(limit=1)
+    request = _request("10.0.0.1", {"X-Forwarded-For": "1.2.3.4"})
+    assert limiter.client_id(request) == "10.0.0.1"
+
+
+def test_client_header_uses_entry_appended_by_proxy():
+    limiter = RateLimiter(limit=1, client_header="X-Forwarded-For")
+    assert limiter.client_id(_request("10.0.0.1", {"X-Forwarded-For": "6.6.6.6, 1.2.3.4"})) == "1.2.3.4"
+    assert limiter.client_id(_request("10.0.0.1", {"X-Forwarded-For": "1.2.3.4"})) == "1.2.3.4"
+    assert limiter.client_id(_request("10.0.0.1")) == "10.0.0.1"
+
+
+def test_clients_behind_proxy_get_separate_buckets(clock):
+    limiter = RateLimiter(limit=1, client_header="X-Forwarded-For")
+    asyncio.run(limiter(_request("10.0.0.1", {"X-Forwarded-For": "1.2.3.4"})))
+    asyncio.run(limiter(_request("10.0.0.1", {"X-Forwarded-For": "5.6.7.8"})))
+    with pytest.raises(HTTPException):
+        asyncio.run(limiter(_request("10.0.0.1", {"X-Forwarded-For": "1.2.3.4"})))
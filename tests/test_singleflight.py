@@ -0,0 +1,90 @@
+"""Unit tests for utils.singleflight.SingleFlight"""
+import asyncio
+
+import pytest
+
+from utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"login": "octocat"}
+
+        results = await asyncio.gather(*(flight.do("octocat", fetch) for _ in range(5)))
+        return calls, results, flight.in_flight("octocat")
+
+    calls, results, in_flight = asyncio.run(scenario())
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert not in_flight
+
+
+def test_exception_fans_out_to_every_caller():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("User 'ghost' not found on GitHub")
+
+        results = await asyncio.gather(
+            *(flight.do("ghost", fetch) for _ in range(3)),
+            return_exceptions=True
+        )
+        return calls, results, flight.in_flight("ghost")
+
+    calls, results, in_flight = asyncio.run(scenario())
+    assert calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not in_flight
+
+
+def test_caller_cancellation_does_not_cancel_shared_task():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("octocat", fetch))
+        follower = asyncio.ensure_future(flight.do("octocat", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == "done"
+
+
+def test_new_call_after_completion_runs_again():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        first = await flight.do("octocat", fetch)
+        second = await flight.do("octocat", fetch)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
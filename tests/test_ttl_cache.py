@@ -0,0 +1,48 @@
+"""Unit tests for utils.ttl_cache.LocalTTLCache"""
+from types import SimpleNamespace
+
+import pytest
+
+from utils import ttl_cache
+from utils.ttl_cache import LocalTTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic() inside the cache."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now.value)
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = LocalTTLCache(maxsize=10, ttl=30)
+    cache.set("a", 1)
+    clock.value += 29
+    assert cache.get("a") == 1
+    clock.value += 1
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = LocalTTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_total_size_is_capped_by_bytes(clock):
+    cache = LocalTTLCache(maxsize=100, ttl=30, max_bytes=10, sizeof=len)
+    cache.set("a", b"x" * 4)
+    cache.set("b", b"x" * 4)
+    cache.set("a", b"x" * 5)  # Replacing an entry doesn't count it twice
+    assert cache.get("b") == b"x" * 4
+    cache.set("c", b"x" * 4)
+    assert cache.get("a") is None
+    assert cache._bytes == 8
+
+    cache.pop("b")
+    cache.clear()
+    assert cache._bytes == 0